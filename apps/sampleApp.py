@@ -1,85 +1,342 @@
 # Example usage
+import hashlib
+import hmac
 import json
+import logging
+import secrets
 import threading
+import time
+from collections import OrderedDict, defaultdict, namedtuple
+from itertools import count
+from types import MappingProxyType
 from daemon.weaprous import WeApRous
+
+try:
+    # C-level lock with a cheap uncontended fast path, when installed
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    _Lock = threading.Lock
 # from daemon.httpadapter import HttpAdapter
 from daemon.resp_template import RESP_TEMPLATES
-from daemon.utils import parse_form_or_json
+from daemon.utils import parse_form_or_json, json_dumps, json_loads
+
+log = logging.getLogger(__name__)
 
 # Initialize the WeApRous app
 app = WeApRous()
 
 # Global data structures for tracking
-peers_list = []  # List of active peers: [{"username": str, "ip": str, "port": int, "channels": []}]
-channels_list = {}  # Dictionary of channels: {channel_name: [usernames]}
-users_credentials = {"admin": "password"}  # Simple user database
-peers_lock = threading.Lock()  # Thread-safe access to peers_list
-channels_lock = threading.Lock()  # Thread-safe access to channels_list
+# Active peers in least-recently-submitted order:
+# {username: {"username": str, "ip": str, "port": int, "channels": []}}
+peers_list = OrderedDict()
+# Tracker bookkeeping kept out of the published peer dicts:
+# {username: (peer_id, last_seen)}
+_peer_meta = {}
+channels_list = defaultdict(set)  # Dictionary of channels: {channel_name: {usernames}}
+peers_lock = _Lock()  # Thread-safe access to peers_list
+channels_lock = _Lock()  # Thread-safe access to channels_list
+
+PEER_TTL = 300  # Seconds without a /submit-info before a peer is dropped
+MAX_PEERS = 10000  # Hard cap on tracked peers; oldest are evicted first
+_peer_ids = count()
+
+# Per-process key for password digests; credentials only live in memory,
+# so there is nothing to keep compatible across restarts.
+SECRET_KEY = secrets.token_bytes(32)
+
+
+def _hash_password(password):
+    """Return the keyed BLAKE2b digest stored for ``password``."""
+    return hashlib.blake2b(str(password).encode("utf-8"), digest_size=32,
+                           key=SECRET_KEY).digest()
+
+
+users_credentials = {"admin": _hash_password("password")}  # {username: password digest}
+
+# Read-only copies for get-list and status. Writers only bump a version
+# when they actually change something; the next reader retakes the copy.
+_Snapshot = namedtuple("_Snapshot", ["data", "version"])
+_peers_version = 0
+_peers_snapshot = _Snapshot({}, 0)
+_channels_version = 0
+_channels_snapshot = _Snapshot({}, 0)
+_dirty_channels = set()  # Channels changed since _channels_snapshot was taken
+
+# Bumped by every write that can change the /status counters; status
+# re-serializes only when the version has moved.
+_versions = count(1)
+_state_version = 0
+_status_cache = (-1, "")
+
+
+def _bump_state():
+    """Mark the tracker state as changed for the /status cache."""
+    global _state_version
+    _state_version = next(_versions)
+
+
+def _peers_changed():
+    """Record a change to peers_list. Caller must hold peers_lock."""
+    global _peers_version
+    _peers_version += 1
+    _bump_state()
+
+
+def _channel_changed(channel):
+    """Record a change to ``channel``'s members. Caller must hold channels_lock."""
+    global _channels_version
+    _dirty_channels.add(channel)
+    _channels_version += 1
+    _bump_state()
+
+
+def _evict_stale_peers(now):
+    """
+    Drop peers past PEER_TTL and trim the table to MAX_PEERS.
+    Caller must hold peers_lock.
+
+    :return: usernames that were evicted.
+    """
+    evicted = []
+    deadline = now - PEER_TTL
+    size = len(peers_list)
+    while size:
+        username = next(iter(peers_list))
+        if _peer_meta[username][1] >= deadline and size <= MAX_PEERS:
+            break
+        del peers_list[username]
+        del _peer_meta[username]
+        evicted.append(username)
+        size -= 1
+    return evicted
+
+
+def _current_peers():
+    """
+    Return the peers snapshot, retaken only after peers_list has changed.
+
+    Peer dicts are never mutated once stored in peers_list (writers swap
+    in a new dict instead), so the snapshot can share them without copying.
+    """
+    global _peers_snapshot
+    snapshot = _peers_snapshot
+    if snapshot.version != _peers_version:
+        with peers_lock:
+            # Readers that queued behind a rebuild reuse its result
+            snapshot = _peers_snapshot
+            if snapshot.version != _peers_version:
+                snapshot = _peers_snapshot = _Snapshot(dict(peers_list), _peers_version)
+    return snapshot.data
+
+
+def _current_channels():
+    """
+    Return the channels snapshot, retaken only after a channel has changed.
+
+    Only channels recorded in _dirty_channels have their member tuples
+    rebuilt; the rest are carried over from the previous snapshot.
+    """
+    global _channels_snapshot
+    snapshot = _channels_snapshot
+    if snapshot.version != _channels_version:
+        with channels_lock:
+            snapshot = _channels_snapshot
+            if snapshot.version != _channels_version:
+                data = dict(snapshot.data)
+                for channel in _dirty_channels:
+                    members = channels_list.get(channel)
+                    if members:
+                        data[channel] = tuple(members)
+                    else:
+                        data.pop(channel, None)
+                _dirty_channels.clear()
+                snapshot = _channels_snapshot = _Snapshot(data, _channels_version)
+    return snapshot.data
+
+
+def _apply_submit(username, ip, port, channels, _peers=peers_list,
+                  _meta=_peer_meta, _channels=channels_list,
+                  _touch=_channel_changed, _now=time.time, _ids=_peer_ids):
+    """
+    Register or refresh a peer and its channels. Called through _apply_write.
+
+    The keyword defaults bind module state once so the body uses local
+    lookups; the bound objects are never rebound.
+
+    :return: (peer_id, total_peers)
+    """
+    now = _now()
+    peer = {
+        "username": username,
+        "ip": ip,
+        "port": port,
+        "channels": list(channels)
+    }
+    # Check if peer already exists (update if exists). A refresh that
+    # neither changes the peer nor its place in the order leaves the
+    # snapshot valid.
+    existing = _peers.get(username)
+    if existing is not None:
+        peer_id = _meta[username][0]
+        changed = existing != peer
+        if next(reversed(_peers)) != username:
+            _peers.move_to_end(username)
+            changed = True
+        log.debug("[ChatApp] Updated existing peer: %s", username)
+    else:
+        peer_id = next(_ids)
+        changed = True
+        log.debug("[ChatApp] Added new peer: %s", username)
+
+    if changed:
+        _peers[username] = peer
+    _meta[username] = (peer_id, now)
+    evicted = _evict_stale_peers(now)
+    if changed or evicted:
+        _peers_changed()
+
+    for channel in channels:
+        members = _channels[channel]
+        if username not in members:
+            members.add(username)
+            _touch(channel)
+    if evicted:
+        for channel, members in list(_channels.items()):
+            if members.isdisjoint(evicted):
+                continue
+            members.difference_update(evicted)
+            _touch(channel)
+            if not members:
+                del _channels[channel]
+    return peer_id, len(_peers)
+
+
+def _apply_add(username, channel, _peers=peers_list, _channels=channels_list,
+               _touch=_channel_changed):
+    """
+    Add ``username`` to ``channel``. Called through _apply_write.
+
+    :return: (message, members)
+    """
+    members_set = _channels[channel]
+    if username not in members_set:
+        members_set.add(username)
+        _touch(channel)
+        message = "User added to channel successfully"
+    else:
+        message = "User already in channel"
+
+    # Update peer's channel list
+    peer = _peers.get(username)
+    if peer is not None and channel not in peer["channels"]:
+        _peers[username] = dict(peer, channels=peer["channels"] + [channel])
+        _peers_changed()
+    return message, list(members_set)
+
+
+def _apply_write(apply, *args, _plock=peers_lock, _clock=channels_lock):
+    """
+    Run ``apply(*args)`` under both locks. Snapshots are not rebuilt here:
+    the apply functions bump a version when they change something and the
+    next reader retakes the copy.
+
+    :return: whatever ``apply`` returns.
+    """
+    with _plock, _clock:
+        return apply(*args)
+
+
+def _template_response(name, extra_headers=True):
+    """Build a constant (status, headers, body) triple from RESP_TEMPLATES."""
+    e = RESP_TEMPLATES[name]
+    headers = {"Content-Type": e["content_type"]}
+    if extra_headers:
+        headers.update(e["headers"])
+    # The adapter copies hook headers before adding its own, so the
+    # shared dict can be frozen.
+    return (e["status"], MappingProxyType(headers), e["body"])
+
+
+# Request body schemas: (required fields, ((optional field, default), ...)).
+_SUBMIT_SCHEMA = (("username", "ip", "port"), (("channels", ()),))
+_ADD_SCHEMA = (("username", "channel"), ())
+_REGISTER_SCHEMA = (("username", "password"), ())
+
+
+def _fields(body, required, optional=()):
+    """
+    Pull the ``required`` fields, then the ``optional`` ones, out of a
+    decoded JSON body in declaration order.
+
+    :return: list of values, or None if the body is not an object or a
+        required field is missing or empty.
+    """
+    if not isinstance(body, dict):
+        return None
+    values = [body.get(name) for name in required]
+    if not all(values):
+        return None
+    values.extend([body.get(name, default) for name, default in optional])
+    return values
+
+
+# Fixed failure replies, encoded once.
+_ERR_MISSING_FIELDS = b'{"status":"failed","message":"Missing required fields"}'
+_ERR_MISSING_CHANNEL = b'{"status":"failed","message":"Missing username or channel"}'
+_ERR_MISSING_CREDENTIALS = b'{"status":"failed","message":"Missing username or password"}'
+_ERR_USER_EXISTS = b'{"status":"failed","message":"Username already exists"}'
+
+_OK_RESP = _template_response("api_ok")
+_FAIL_RESP = _template_response("login_failed", extra_headers=False)
+_ERR_RESP = _template_response("server_error")
 
 @app.route(path='/login', methods=['POST'])
 def login(headers="guest", body="anonymous"):
     """
     Handle user login via POST request.
 
-    This route simulates a login process and prints the provided headers and body
-    to the console.
+    This route simulates a login process and logs the provided headers and body
+    at debug level.
 
     :param headers (str): The request headers or user identifier.
     :param body (str): The request body or login payload.
     """
-    print("[SampleApp] Logging in {} to {}".format(headers, body))
+    log.debug("[SampleApp] Logging in %s to %s", headers, body)
 
     try:
         data = parse_form_or_json(body)
 
-        print("[DATA] {}".format(data))
-
         username = data.get("username", "")
         password = data.get("password", "")
         
-        print("[SampleApp] Login attempt: username={}".format(username))
+        log.debug("[SampleApp] Login attempt: username=%s", username)
         
         # Validate credentials
-        if username in users_credentials and users_credentials[username] == password:
-            e = RESP_TEMPLATES["api_ok"]
-            response = (
-                e["status"],
-                {"Content-Type": e["content_type"], **e["headers"]},
-                e["body"]
-            )
-            print("[SampleApp] Login successful for user: {}".format(username))
+        stored = users_credentials.get(username)
+        if stored is not None and hmac.compare_digest(stored, _hash_password(password)):
+            response = _OK_RESP
+            log.debug("[SampleApp] Login successful for user: %s", username)
         else:
-            e = RESP_TEMPLATES["login_failed"]
-            response = (
-                e["status"],
-                {"Content-Type": e["content_type"]},
-                e["body"]
-            )
-            print("[SampleApp] Login failed for user: {}".format(username))
+            response = _FAIL_RESP
+            log.debug("[SampleApp] Login failed for user: %s", username)
         
         return response
     
     except Exception as e:
-        print("[SampleApp] Error in login: {}".format(e))
-        e = RESP_TEMPLATES["server_error"]
-        return (
-            e["status"],
-            {"Content-Type": e["content_type"], **e["headers"]},
-            e["body"]
-        )
+        log.warning("[SampleApp] Error in login: %s", e)
+        return _ERR_RESP
 
 @app.route('/hello', methods=['PUT'])
 def hello(headers, body):
     """
     Handle greeting via PUT request.
 
-    This route prints a greeting message to the console using the provided headers
-    and body.
+    This route logs a greeting message using the provided headers and body.
 
     :param headers (str): The request headers or user identifier.
     :param body (str): The request body or message payload.
     """
-    print("[SampleApp] ['PUT'] Hello in {} to {}".format(headers, body))
+    log.info("[SampleApp] ['PUT'] Hello in %s to %s", headers, body)
 
 @app.route("/", methods=["GET"])
 def home(headers=None, body=None):
@@ -92,13 +349,13 @@ def get_user(headers=None, body=None):
 @app.route("/echo", methods=["POST"])
 def echo(headers=None, body=None):
     try:
-        data = json.loads(body)
+        data = json_loads(body)
         return {"received": data}
     except json.JSONDecodeError:
         return {"error": "Invalid JSON"}
 
-@app.route('/submit-info', methods=['POST'])
-def submit_info(headers="guest", body="anonymous"):
+@app.route('/submit-info', methods=['POST'], parse_json=True)
+def submit_info(headers="guest", body=None):
     """
     Handle peer registration - peers submit their info to the tracker.
     
@@ -106,74 +363,38 @@ def submit_info(headers="guest", body="anonymous"):
     Response: {"status": "success"/"failed", "message": str, "peer_id": int}
     
     :param headers (str): The request headers
-    :param body (str): The request body containing peer information
+    :param body (dict): The decoded JSON body containing peer information
     :return: JSON response with registration status
     """
-    print("[ChatApp] Peer registration request received")
+    log.debug("[ChatApp] Peer registration request received")
     
     try:
-        # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
-        ip = data.get("ip", "")
-        port = data.get("port", 0)
-        channels = data.get("channels", [])
-        
-        print("[ChatApp] Registering peer: username={}, ip={}, port={}".format(username, ip, port))
+        fields = _fields(body, *_SUBMIT_SCHEMA)
+        if fields is None:
+            return _ERR_MISSING_FIELDS
+        username, ip, port, channels = fields
         
-        if not username or not ip or not port:
-            return json.dumps({"status": "failed", "message": "Missing required fields"})
+        log.debug("[ChatApp] Registering peer: username=%s, ip=%s, port=%s", username, ip, port)
         
-        # Thread-safe peer registration
-        with peers_lock:
-            # Check if peer already exists (update if exists)
-            existing_peer = None
-            for i, peer in enumerate(peers_list):
-                if peer["username"] == username:
-                    existing_peer = i
-                    break
-            
-            peer_info = {
-                "username": username,
-                "ip": ip,
-                "port": port,
-                "channels": channels
-            }
-            
-            if existing_peer is not None:
-                peers_list[existing_peer] = peer_info
-                peer_id = existing_peer
-                print("[ChatApp] Updated existing peer: {}".format(username))
-            else:
-                peers_list.append(peer_info)
-                peer_id = len(peers_list) - 1
-                print("[ChatApp] Added new peer: {}".format(username))
-        
-        # Update channels
-        with channels_lock:
-            for channel in channels:
-                if channel not in channels_list:
-                    channels_list[channel] = []
-                if username not in channels_list[channel]:
-                    channels_list[channel].append(username)
+        peer_id, total_peers = _apply_write(_apply_submit, username, ip, port, channels)
         
         response = {
             "status": "success",
             "message": "Peer registered successfully",
             "peer_id": peer_id,
-            "total_peers": len(peers_list)
+            "total_peers": total_peers
         }
         
-        print("[ChatApp] Peer registered: {} (total peers: {})".format(username, len(peers_list)))
-        return json.dumps(response)
+        log.debug("[ChatApp] Peer registered: %s (total peers: %s)", username, total_peers)
+        return json_dumps(response)
     
     except Exception as e:
-        print("[ChatApp] Error in submit-info: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in submit-info: %s", e)
+        return json_dumps({"status": "error", "message": str(e)})
 
 
-@app.route('/add-list', methods=['POST'])
-def add_list(headers="guest", body="anonymous"):
+@app.route('/add-list', methods=['POST'], parse_json=True)
+def add_list(headers="guest", body=None):
     """
     Handle channel creation/subscription.
     
@@ -181,61 +402,40 @@ def add_list(headers="guest", body="anonymous"):
     Response: {"status": "success"/"failed", "message": str, "members": [str]}
     
     :param headers (str): The request headers
-    :param body (str): The request body containing channel information
+    :param body (dict): The decoded JSON body containing channel information
     :return: JSON response with channel status
     """
-    print("[ChatApp] Add to channel request received")
+    log.debug("[ChatApp] Add to channel request received")
     
     try:
-        # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
-        channel = data.get("channel", "")
+        fields = _fields(body, *_ADD_SCHEMA)
+        if fields is None:
+            return _ERR_MISSING_CHANNEL
+        username, channel = fields
         
-        print("[ChatApp] Adding user {} to channel {}".format(username, channel))
+        log.debug("[ChatApp] Adding user %s to channel %s", username, channel)
         
-        if not username or not channel:
-            return json.dumps({"status": "failed", "message": "Missing username or channel"})
-        
-        # Thread-safe channel update
-        with channels_lock:
-            if channel not in channels_list:
-                channels_list[channel] = []
-            
-            if username not in channels_list[channel]:
-                channels_list[channel].append(username)
-                message = "User added to channel successfully"
-            else:
-                message = "User already in channel"
-            
-            members = channels_list[channel][:]
-        
-        # Update peer's channel list
-        with peers_lock:
-            for peer in peers_list:
-                if peer["username"] == username:
-                    if channel not in peer["channels"]:
-                        peer["channels"].append(channel)
-                    break
+        message, members = _apply_write(_apply_add, username, channel)
+        member_count = len(members)
         
         response = {
             "status": "success",
             "message": message,
             "channel": channel,
             "members": members,
-            "member_count": len(members)
+            "member_count": member_count
         }
         
-        print("[ChatApp] Channel {} now has {} members".format(channel, len(members)))
-        return json.dumps(response)
+        log.debug("[ChatApp] Channel %s now has %s members", channel, member_count)
+        return json_dumps(response)
     
     except Exception as e:
-        print("[ChatApp] Error in add-list: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in add-list: %s", e)
+        return json_dumps({"status": "error", "message": str(e)})
 
 
-@app.route('/get-list', methods=['GET', 'POST'])
-def get_list(headers="guest", body="anonymous"):
+@app.route('/get-list', methods=['GET', 'POST'], parse_json=True)
+def get_list(headers="guest", body=None):
     """
     Get list of active peers or channel members.
     
@@ -243,35 +443,26 @@ def get_list(headers="guest", body="anonymous"):
     Response: {"status": "success", "peers": [...], "channels": {...}}
     
     :param headers (str): The request headers
-    :param body (str): Optional filter parameters
+    :param body (dict): Optional filter parameters from the decoded JSON body
     :return: JSON response with peer/channel list
     """
-    print("[ChatApp] Get list request received")
+    log.debug("[ChatApp] Get list request received")
     
     try:
-        # Parse JSON body if provided
-        data = {}
-        if body and body != "anonymous":
-            try:
-                data = json.loads(body)
-            except:
-                pass
-        
-        channel_filter = data.get("channel", None)
-        username_filter = data.get("username", None)
+        channel_filter = body.get("channel", None)
+        username_filter = body.get("username", None)
         
-        # Thread-safe read
-        with peers_lock:
-            peers_copy = [peer.copy() for peer in peers_list]
-        
-        with channels_lock:
-            channels_copy = {k: v[:] for k, v in channels_list.items()}
+        # Snapshots; only retaken (under the lock) after a write changed them
+        peers_copy = _current_peers()
+        channels_copy = _current_channels()
+        peer_count = len(peers_copy)
+        channel_count = len(channels_copy)
         
         # Apply filters
         if channel_filter and channel_filter in channels_copy:
             # Get peers in specific channel
-            channel_members = channels_copy[channel_filter]
-            filtered_peers = [p for p in peers_copy if p["username"] in channel_members]
+            filtered_peers = [peers_copy[name] for name in channels_copy[channel_filter]
+                              if name in peers_copy]
             response = {
                 "status": "success",
                 "channel": channel_filter,
@@ -280,7 +471,7 @@ def get_list(headers="guest", body="anonymous"):
             }
         elif username_filter:
             # Get specific user's info
-            user_peer = [p for p in peers_copy if p["username"] == username_filter]
+            user_peer = [peers_copy[username_filter]] if username_filter in peers_copy else []
             user_channels = channels_copy
             response = {
                 "status": "success",
@@ -291,23 +482,23 @@ def get_list(headers="guest", body="anonymous"):
             # Get all peers and channels
             response = {
                 "status": "success",
-                "peers": peers_copy,
+                "peers": list(peers_copy.values()),
                 "channels": channels_copy,
-                "total_peers": len(peers_copy),
-                "total_channels": len(channels_copy)
+                "total_peers": peer_count,
+                "total_channels": channel_count
             }
         
-        print("[ChatApp] Returned list: {} peers, {} channels".format(
-            len(peers_copy), len(channels_copy)))
-        return json.dumps(response)
+        log.debug("[ChatApp] Returned list: %d peers, %d channels",
+                  peer_count, channel_count)
+        return json_dumps(response)
     
     except Exception as e:
-        print("[ChatApp] Error in get-list: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in get-list: %s", e)
+        return json_dumps({"status": "error", "message": str(e)})
 
 
-@app.route('/register', methods=['POST'])
-def register(headers="guest", body="anonymous"):
+@app.route('/register', methods=['POST'], parse_json=True)
+def register(headers="guest", body=None):
     """
     Register new user account.
     
@@ -315,27 +506,25 @@ def register(headers="guest", body="anonymous"):
     Response: {"status": "success"/"failed", "message": str}
     
     :param headers (str): The request headers
-    :param body (str): The request body containing registration info
+    :param body (dict): The decoded JSON body containing registration info
     :return: JSON response with registration status
     """
-    print("[ChatApp] User registration request received")
+    log.debug("[ChatApp] User registration request received")
     
     try:
-        # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
-        password = data.get("password", "")
-        
-        print("[ChatApp] Registration attempt: username={}".format(username))
+        fields = _fields(body, *_REGISTER_SCHEMA)
+        if fields is None:
+            return _ERR_MISSING_CREDENTIALS
+        username, password = fields
         
-        if not username or not password:
-            return json.dumps({"status": "failed", "message": "Missing username or password"})
+        log.debug("[ChatApp] Registration attempt: username=%s", username)
         
-        if username in users_credentials:
-            return json.dumps({"status": "failed", "message": "Username already exists"})
-        
-        # Register new user
-        users_credentials[username] = password
+        # Register new user. setdefault is a single check-and-insert, so two
+        # concurrent registrations of the same name cannot both succeed.
+        digest = _hash_password(password)
+        if users_credentials.setdefault(username, digest) is not digest:
+            return _ERR_USER_EXISTS
+        _bump_state()
         
         response = {
             "status": "success",
@@ -343,12 +532,12 @@ def register(headers="guest", body="anonymous"):
             "username": username
         }
         
-        print("[ChatApp] User registered: {}".format(username))
-        return json.dumps(response)
+        log.debug("[ChatApp] User registered: %s", username)
+        return json_dumps(response)
     
     except Exception as e:
-        print("[ChatApp] Error in register: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in register: %s", e)
+        return json_dumps({"status": "error", "message": str(e)})
 
 
 @app.route('/status', methods=['GET'])
@@ -362,19 +551,21 @@ def status(headers="guest", body="anonymous"):
     :param body (str): Not used
     :return: JSON response with server status
     """
-    with peers_lock:
-        peer_count = len(peers_list)
-    
-    with channels_lock:
-        channel_count = len(channels_list)
+    global _status_cache
+    version = _state_version
+    cached_version, cached_body = _status_cache
+    if cached_version == version:
+        return cached_body
     
     response = {
         "status": "online",
         "stats": {
-            "total_peers": peer_count,
-            "total_channels": channel_count,
+            "total_peers": len(_current_peers()),
+            "total_channels": len(_current_channels()),
             "total_users": len(users_credentials)
         }
     }
     
-    return json.dumps(response)
\ No newline at end of file
+    body = json_dumps(response)
+    _status_cache = (version, body)
+    return body
\ No newline at end of file
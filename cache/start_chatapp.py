@@ -33,14 +33,20 @@ import argparse
 import threading
 from daemon.weaprous import WeApRous
 
+try:
+    # C-level lock with a cheap uncontended fast path, when installed
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    _Lock = threading.Lock
+
 PORT = 8001  # Default port for chat tracker server
 
 # Global data structures for tracking
 peers_list = []  # List of active peers: [{"username": str, "ip": str, "port": int, "channels": []}]
 channels_list = {}  # Dictionary of channels: {channel_name: [usernames]}
 users_credentials = {"admin": "password"}  # Simple user database
-peers_lock = threading.Lock()  # Thread-safe access to peers_list
-channels_lock = threading.Lock()  # Thread-safe access to channels_list
+peers_lock = _Lock()  # Thread-safe access to peers_list
+channels_lock = _Lock()  # Thread-safe access to channels_list
 #Thread 1 add peer"alice"
 #Thread 2 add peer "bob""
 
@@ -30,7 +30,9 @@ Requirements:
 
 Notes:
 ------
-- The server create daemon threads for client handling.
+- The server create daemon threads for client handling, or reads every request
+  on one asyncio event loop (uvloop when installed) with ``use_asyncio=True``
+  and answers it from a small thread pool.
 - The current implementation error handling is minimal, socket errors are printed to the console.
 - The actual request processing is delegated to the HttpAdapter class.
 
@@ -40,12 +42,20 @@ Usage Example:
 
 """
 
+import os
 import socket
+import asyncio
 import threading
 import argparse
 
+try:
+    # Drop-in libuv event loop, used by the asyncio backend when installed
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .response import *
-from .httpadapter import HttpAdapter
+from .httpadapter import HttpAdapter, RECV_SIZE, MAX_HEADER_SIZE, request_size, set_send_timeout
 from .dictionary import CaseInsensitiveDict
 
 def handle_client(ip, port, conn, addr, routes):
@@ -63,7 +73,23 @@ def handle_client(ip, port, conn, addr, routes):
     # Handle client
     httpAdapter.handle_client(conn, addr, routes)
 
-def run_backend(ip, port, routes):
+def listen_socket(ip, port, reuse_port=False):
+    """
+    Create a TCP socket bound to ``(ip, port)`` and listening.
+
+    :param ip (str): IP address to bind the server.
+    :param port (int): Port number to listen on.
+    :param reuse_port (bool): Set SO_REUSEPORT so several processes can share
+        the port and let the kernel balance connections between them.
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if reuse_port:
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    server.bind((ip, port))
+    server.listen(50)
+    return server
+
+def run_backend(ip, port, routes, reuse_port=False):
     """
     Starts the backend server, binds to the specified IP and port, and listens for incoming
     connections. Each connection is handled in a separate thread. The backend accepts incoming
@@ -73,13 +99,11 @@ def run_backend(ip, port, routes):
     :param ip (str): IP address to bind the server.
     :param port (int): Port number to listen on.
     :param routes (dict): Dictionary of route handlers.
+    :param reuse_port (bool): Bind with SO_REUSEPORT.
     """
-    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    #
 
     try:
-        server.bind((ip, port))
-        server.listen(50)
+        server = listen_socket(ip, port, reuse_port)
         print("[Backend] Listening on port {}".format(port))
         if routes != {}:
             print("[Backend] route settings {}".format(routes))
@@ -98,13 +122,122 @@ def run_backend(ip, port, routes):
     except socket.error as e:
       print("Socket error: {}".format(e))
 
-def create_backend(ip, port, routes={}):
+async def handle_client_async(ip, port, conn, addr, routes):
+    """
+    Read a request without blocking the event loop, then hand the connection
+    to an HttpAdapter on a worker thread.
+
+    :param ip (str): IP address of the server.
+    :param port (int): Port number the server is listening on.
+    :param conn (socket.socket): Non-blocking client connection socket.
+    :param addr (tuple): client address (IP, port).
+    :param routes (dict): Dictionary of route handlers.
+    """
+    loop = asyncio.get_running_loop()
+    buf = bytearray()
+    total = None
+    try:
+        while total is None or len(buf) < total:
+            chunk = await loop.sock_recv(conn, RECV_SIZE)
+            if not chunk:
+                break
+            buf += chunk
+            if total is None:
+                # Only the tail of the previous chunk can hold part of the
+                # terminator; don't rescan the whole header block each time.
+                total = request_size(buf, start=max(0, len(buf) - len(chunk) - 3))
+                if total is None and len(buf) > MAX_HEADER_SIZE:
+                    break
+    except OSError:
+        conn.close()
+        return
+
+    # Writing can block for as long as the client takes to read (static
+    # files included), so the response is built and sent on a worker
+    # thread rather than the loop. The send timeout stops a client that
+    # never reads from holding that worker forever.
+    conn.setblocking(True)
+    set_send_timeout(conn)
+    try:
+        await loop.run_in_executor(
+            None, handle_client_raw, ip, port, conn, addr, routes, bytes(buf))
+    except OSError:
+        conn.close()
+
+def handle_client_raw(ip, port, conn, addr, routes, raw):
+    """
+    Like :func:`handle_client`, for a request the caller has already read.
+
+    :param raw (bytes): The complete request.
+    """
+    httpAdapter = HttpAdapter(ip, port, conn, addr, routes)
+    httpAdapter.handle_client(conn, addr, routes, raw=raw)
+
+async def serve_async(ip, port, routes, reuse_port=False):
+    """
+    Event-loop variant of :func:`run_backend`. Accepting and reading happen
+    cooperatively on a single thread; each complete request is then handled
+    and answered on the loop's default thread pool.
+
+    :param ip (str): IP address to bind the server.
+    :param port (int): Port number to listen on.
+    :param routes (dict): Dictionary of route handlers.
+    :param reuse_port (bool): Bind with SO_REUSEPORT.
+    """
+    loop = asyncio.get_running_loop()
+    server = listen_socket(ip, port, reuse_port)
+    server.setblocking(False)
+    print("[Backend] Listening on port {} (asyncio)".format(port))
+    if routes != {}:
+        print("[Backend] route settings {}".format(routes))
+
+    while True:
+        conn, addr = await loop.sock_accept(server)
+        loop.create_task(handle_client_async(ip, port, conn, addr, routes))
+
+def run_backend_async(ip, port, routes, reuse_port=False):
+    """
+    Run :func:`serve_async` to completion, on uvloop when it is installed.
+
+    :param ip (str): IP address to bind the server.
+    :param port (int): Port number to listen on.
+    :param routes (dict): Dictionary of route handlers.
+    :param reuse_port (bool): Bind with SO_REUSEPORT.
+    """
+    if uvloop is not None:
+        uvloop.install()
+    try:
+        asyncio.run(serve_async(ip, port, routes, reuse_port))
+    except socket.error as e:
+        print("Socket error: {}".format(e))
+
+def create_backend(ip, port, routes={}, use_asyncio=False, processes=1):
     """
     Entry point for creating and running the backend server.
 
+    With ``processes > 1`` the server forks that many workers, each binding the
+    same port with SO_REUSEPORT. Workers do not share memory, so this only suits
+    apps whose route handlers keep no state of their own.
+
     :param ip (str): IP address to bind the server.
     :param port (int): Port number to listen on.
     :param routes (dict, optional): Dictionary of route handlers. Defaults to empty dict.
+    :param use_asyncio (bool, optional): Serve from a single-threaded event loop
+        instead of a thread per connection. Defaults to False.
+    :param processes (int, optional): Number of worker processes. Defaults to 1.
     """
 
-    run_backend(ip, port, routes)
+    reuse_port = False
+    if processes > 1:
+        if not hasattr(os, "fork") or not hasattr(socket, "SO_REUSEPORT"):
+            print("[Backend] Multiple processes need fork() and SO_REUSEPORT; using one")
+        else:
+            reuse_port = True
+            for _ in range(processes - 1):
+                if os.fork() == 0:
+                    break
+
+    if use_asyncio:
+        run_backend_async(ip, port, routes, reuse_port)
+    else:
+        run_backend(ip, port, routes, reuse_port)
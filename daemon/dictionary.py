@@ -54,4 +54,17 @@ class CaseInsensitiveDict(MutableMapping):
     def __len__(self):
         return len(self.store)
 
+    def __contains__(self, key):
+        return key.lower() in self.store
+
+    def get(self, key, default=None):
+        return self.store.get(key.lower(), default)
+
+    def get_lower(self, key, default=None):
+        """Like :meth:`get` for a ``key`` that is already lower-case."""
+        return self.store.get(key, default)
+
+    def clear(self):
+        self.store.clear()
+
 
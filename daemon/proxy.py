@@ -63,13 +63,13 @@ def forward_request(host, port, request):
     try:
         backend.connect((host, port))
         backend.sendall(request.encode())
-        response = b""
+        chunks = []
         while True:
             chunk = backend.recv(4096)
             if not chunk:
                 break
-            response += chunk
-        return response
+            chunks.append(chunk)
+        return b"".join(chunks)
     except socket.error as e:
         print("Socket error: {}".format(e))
         return (
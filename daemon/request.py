@@ -17,9 +17,15 @@ daemon.request
 This module provides a Request object to manage and persist 
 request settings (cookies, auth, proxies).
 """
+import re
+
 from .dictionary import CaseInsensitiveDict
 from .utils import get_auth_from_url
 
+# "name=value" pairs of a Cookie header, surrounding whitespace excluded.
+# Values are kept verbatim (no URL-decoding), as browsers send them.
+_COOKIE_RE = re.compile(r"\s*([^=;\s][^=;]*?)\s*=\s*([^;]*?)\s*(?:;|$)")
+
 
 class Request():
     """The fully mutable "class" `Request <Request>` object,
@@ -29,6 +35,8 @@ class Request():
     should not be instantiated manually; doing so may produce undesirable
     effects.
 
+    After :meth:`prepare`, ``body`` is always bytes (``b""`` when absent).
+
     Usage::
 
       >>> import deamon.request
@@ -68,38 +76,64 @@ class Request():
         #: Hook point for routed mapped-path
         self.hook = None
 
-    def extract_request_line(self, request):
+    def reset(self):
+        """
+        Clear per-request state so the object can be reused for the next
+        request. The header and cookie containers are emptied, not replaced.
+        """
+        self.method = None
+        self.url = None
+        self.path = None
+        self.version = None
+        if self.headers is not None:
+            self.headers.clear()
+        if self.cookies is not None:
+            self.cookies.clear()
+        self.body = None
+        self.routes = {}
+        self.hook = None
+
+    def extract_request_line(self, line):
         """
-        Extract method, path and version from the first request line.
+        Extract method, path and version from the request line.
         Returns a 3-tuple or (None, None, None) on failure.
         NOTE: Do not rewrite "/" to "/index.html" here; leave routing to upper layers.
         """
         try:
-            first_line = request.split('\r\n', 1)[0]
-            method, path, version = first_line.strip().split()
+            method, path, version = line.split()
             return method, path, version
         except Exception:
             return None, None, None
 
-             
-    def prepare_headers(self, request):
-        """Prepares the given HTTP headers."""
-        from .dictionary import CaseInsensitiveDict
-        head = request.split('\r\n\r\n', 1)[0]
-        lines = head.split('\r\n')
-        headers = CaseInsensitiveDict()
+    def _parse(self, request, headers=None):
+        """
+        Parse a raw HTTP message in one pass.
+        - Accepts either bytes or str as input.
+        - Fills ``headers`` when given (e.g. a reused, cleared dict).
+        - Returns (request_line:str, headers:CaseInsensitiveDict, body:bytes).
+        """
+        if not isinstance(request, (bytes, bytearray)):
+            request = request.encode("utf-8", "ignore")
+
+        # Split on the first empty line (CRLFCRLF); only the head is decoded
+        head_bytes, _, body_bytes = request.partition(b"\r\n\r\n")
+        lines = head_bytes.decode("utf-8", "ignore").split("\r\n")
+
+        if headers is None:
+            headers = CaseInsensitiveDict()
         for line in lines[1:]:
-            if ': ' in line:
-                key, val = line.split(': ', 1)
+            key, sep, val = line.partition(":")
+            if sep:
                 headers[key.strip()] = val.strip()
-        return headers
-
+        return lines[0], headers, body_bytes
 
     def prepare(self, request, routes=None):
         """Prepares the entire request with the given parameters."""
 
+        request_line, self.headers, body_bytes = self._parse(request, self.headers)
+
         # Prepare the request line from the request header
-        self.method, self.path, self.version = self.extract_request_line(request)
+        self.method, self.path, self.version = self.extract_request_line(request_line)
 
         #
         # @bksysnet Preapring the webapp hook with WeApRous instance
@@ -111,33 +145,27 @@ class Request():
         # Routes / hook
         self.routes = routes or {}
 
-        if self.routes:
-            # Prefer (method, path), allow path-only fallback
-            self.hook = self.routes.get((self.method, self.path)) or self.routes.get(self.path)
+        if self.routes and self.method and self.path:
+            # Prefer "METHOD\x00path" (see httpadapter.route_index), allow
+            # path-only fallback
+            self.hook = self.routes.get(self.method + "\x00" + self.path) or self.routes.get(self.path)
             # print("[Request] Hook {}".format(self.hook))
 
-        # Headers
-        self.headers = self.prepare_headers(request)
-
         # Cookies
-        cookie_str = self.headers.get('Cookie', '') or self.headers.get('cookie', '')
-        self.cookies = {}
+        cookie_str = self.headers.get_lower('cookie', '')
+        if self.cookies is None:
+            self.cookies = {}
         if cookie_str:
-            for cookie_pair in cookie_str.split(';'):
-                cookie_pair = cookie_pair.strip()
-                if '=' in cookie_pair:
-                    k, v = cookie_pair.split('=', 1)
-                    self.cookies[k.strip()] = v.strip()
+            self.cookies.update(_COOKIE_RE.findall(cookie_str))
 
         # Body (bytes) — sliced by Content-Length if present
-        head, body_bytes = self.split_head_body(request)
         try:
-            cl = int(self.headers.get('Content-Length', '0') or 0)
+            cl = int(self.headers.get_lower('content-length', '0') or 0)
         except Exception:
             cl = 0
         if cl > 0 and len(body_bytes) >= cl:
             body_bytes = body_bytes[:cl]
-        self.body = body_bytes  # keep raw bytes; adapter can decode on demand
+        self.body = body_bytes or b""  # keep raw bytes; adapter can decode on demand
 
         return
 
@@ -173,22 +201,3 @@ class Request():
 
     def prepare_cookies(self, cookies):
         self.headers["Cookie"] = cookies
-
-    def split_head_body(self, request: str):
-        """
-        Split raw HTTP message into (head:str, body:bytes).
-        - Accepts either str or bytes as input.
-        - Returns the header section as UTF-8 text (best-effort) and the raw body bytes.
-        """
-        if isinstance(request, bytes):
-            raw = request
-        else:
-            # Best-effort encode so we can safely partition on CRLFCRLF
-            raw = request.encode("utf-8", "ignore")
-
-        # Split on the first empty line (CRLFCRLF)
-        head_bytes, sep, body_bytes = raw.partition(b"\r\n\r\n")
-
-        # Decode headers to str for easier parsing; keep body as bytes
-        head_str = head_bytes.decode("utf-8", "ignore")
-        return head_str, body_bytes
\ No newline at end of file
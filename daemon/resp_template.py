@@ -1,5 +1,6 @@
 # dictionary.py
 from .dictionary import CaseInsensitiveDict   
+from .response import Response
 
 RESP_TEMPLATES = CaseInsensitiveDict({
     # ---- Success ----
@@ -59,3 +60,13 @@ RESP_TEMPLATES = CaseInsensitiveDict({
         "body": b'{"status":"error","message":"internal"}',
     },
 })
+
+# Complete wire-format response for each template, composed once at import.
+# HttpAdapter.send() writes these bytes as-is.
+for _tmpl in RESP_TEMPLATES.values():
+    _tmpl["_prebuilt"] = Response().compose(
+        status=_tmpl["status"],
+        headers={"Content-Type": _tmpl["content_type"], **_tmpl["headers"]},
+        body=_tmpl["body"],
+    )
+del _tmpl
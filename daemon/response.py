@@ -21,12 +21,263 @@ based on incoming requests.
 The current version supports MIME type detection, content loading and header formatting
 """
 import datetime
+import logging
 import os
+import stat
+import time
+import threading
 import mimetypes
+from email.utils import formatdate
+from functools import lru_cache
+from collections import namedtuple, OrderedDict
 from .dictionary import CaseInsensitiveDict
 
+log = logging.getLogger(__name__)
+
 BASE_DIR = ""
 
+#: Block size used when a static file is streamed instead of sent whole.
+STREAM_CHUNK_SIZE = 65536
+
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0)
+# O_NOATIME skips the atime inode update, but only the file owner may use it
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _open_readonly(path):
+    """
+    Open ``path`` for reading without updating its access time where
+    permitted, and tell the kernel it will be read sequentially so it
+    reads ahead more aggressively.
+
+    :raises OSError: if the file cannot be opened.
+    """
+    global _O_NOATIME
+    fd = None
+    if _O_NOATIME:
+        try:
+            fd = os.open(path, _OPEN_FLAGS | _O_NOATIME)
+        except PermissionError:
+            # Not the owner of the served files; don't try again
+            _O_NOATIME = 0
+    if fd is None:
+        fd = os.open(path, _OPEN_FLAGS)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return fd
+
+
+#: Files up to this size are kept in memory after the first read.
+CONTENT_CACHE_MAX_FILE = 256 * 1024
+#: Upper bound on the total bytes held by the static content cache.
+CONTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# filepath -> ((st_mtime_ns, st_size), bytes), least recently used first
+_content_cache = OrderedDict()
+_content_cache_bytes = 0
+_content_cache_lock = threading.Lock()
+
+
+def _read_static(filepath, st=None):
+    """
+    Return the content of ``filepath``, served from memory when the file is
+    small and has not changed (same mtime and size) since it was cached.
+
+    :param st (os.stat_result): a fresh stat of ``filepath``, if the caller
+        already has one.
+    :raises OSError: if the file cannot be read.
+    """
+    global _content_cache_bytes
+    if st is None:
+        st = os.stat(filepath)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _content_cache_lock:
+        entry = _content_cache.get(filepath)
+        if entry is not None and entry[0] == stamp:
+            _content_cache.move_to_end(filepath)
+            return entry[1]
+
+    with open(_open_readonly(filepath), 'rb') as f:
+        content = f.read()
+    if len(content) != st.st_size or st.st_size > CONTENT_CACHE_MAX_FILE:
+        return content
+
+    with _content_cache_lock:
+        old = _content_cache.pop(filepath, None)
+        if old is not None:
+            _content_cache_bytes -= len(old[1])
+        _content_cache[filepath] = (stamp, content)
+        _content_cache_bytes += len(content)
+        while _content_cache_bytes > CONTENT_CACHE_MAX_BYTES:
+            _, (_, evicted) = _content_cache.popitem(last=False)
+            _content_cache_bytes -= len(evicted)
+    return content
+
+
+def _join_static(base_dir, path):
+    """
+    Return the file for request ``path`` under ``base_dir``, or None if the
+    path would escape ``base_dir`` (e.g. ``/../daemon/backend.py``).
+    """
+    if base_dir[-1:] != "/":
+        base_dir += "/"
+    filepath = base_dir + (path[1:] if path[:1] == "/" else path)
+    if ".." in filepath and not os.path.normpath(filepath).startswith(
+            os.path.normpath(base_dir) + os.sep):
+        return None
+    return filepath
+
+
+# Choose base directory via a mapping (override as needed)
+# NOTE: Keep www/ for html, static/ for assets, apps/ for app bundles.
+# Base directories with their trailing separator, so a request path only
+# needs one concatenation (see _join_static).
+_WWW_DIR = os.path.join(BASE_DIR, "www", "")
+_STATIC_DIR = os.path.join(BASE_DIR, "static", "")
+_APPS_DIR = os.path.join(BASE_DIR, "apps", "")
+
+_BASE_MAP = {
+    "text/html":     _WWW_DIR,
+    "text/css":      _STATIC_DIR,
+    "text/plain":    _STATIC_DIR,
+    "text/javascript": _STATIC_DIR,
+    "application/javascript": _STATIC_DIR,
+    "image":         _STATIC_DIR,
+    "font":          _STATIC_DIR,
+    "audio":         _STATIC_DIR,
+    "video":         _STATIC_DIR,
+    # For app payloads served as files (e.g., zip, wasm):
+    "application":   _APPS_DIR,
+}
+
+@lru_cache(maxsize=256)
+def _mime_for_ext(ext):
+    """MIME type for a file extension such as ".css" (cached per extension)."""
+    mime_type, _ = mimetypes.guess_type("f" + ext)
+    return mime_type or 'application/octet-stream'
+
+
+# mime_type -> (base_dir, Content-Type), filled by prepare_content_type
+_MIME_ROUTES = {}
+
+
+def _route_mime(mime_type):
+    """
+    Work out the (base_dir, Content-Type) pair for ``mime_type``.
+
+    :raises ValueError: If the MIME type is unsupported.
+    """
+    if not isinstance(mime_type, str) or '/' not in mime_type:
+        raise ValueError("Invalid MIME type format: {!r}".format(mime_type))
+
+    main_type, sub_type = mime_type.split('/', 1)
+    main_type, sub_type = main_type.strip().lower(), sub_type.strip().lower()
+    log.debug("processing MIME main_type=%s | sub_type=%s", main_type, sub_type)
+
+    # Decide base_dir
+    full = f"{main_type}/{sub_type}"
+    if full in _BASE_MAP:
+        base_dir = _BASE_MAP[full]
+    elif main_type in _BASE_MAP:
+        base_dir = _BASE_MAP[main_type]
+    else:
+        # Fallback to static for unknown types
+        base_dir = _STATIC_DIR
+
+    if main_type == "text":
+        content_type = f"{full}; charset=utf-8"
+    elif main_type == "application" and sub_type in {"json", "xml"}:
+        content_type = full
+    elif main_type in {"image", "audio", "video", "font"}:
+        content_type = full
+    else:
+        content_type = full or "application/octet-stream"
+
+    return base_dir, content_type
+
+
+#: Complete 404 reply for a missing static file.
+_NOTFOUND_BYTES = (
+    b"HTTP/1.1 404 Not Found\r\n"
+    b"Accept-Ranges: bytes\r\n"
+    b"Content-Type: text/html\r\n"
+    b"Content-Length: 13\r\n"
+    b"Cache-Control: max-age=86000\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b"404 Not Found"
+)
+
+#: Shared zero ``elapsed`` value; timedelta is immutable.
+_NO_ELAPSED = datetime.timedelta(0)
+
+def _header_template(accept="%s", language="%s", authorization="%s",
+                     cookie="%s", user_agent="%s"):
+    """
+    Static file response header as a %-format string. Content-Type,
+    Content-Length and Date are always placeholders; the echoed request
+    headers are placeholders unless a fixed value is given.
+    """
+    return (
+        "HTTP/1.1 200 OK\r\n"
+        "Accept: " + accept + "\r\n"
+        "Accept-Language: " + language + "\r\n"
+        "Authorization: " + authorization + "\r\n"
+        "Cache-Control: no-cache\r\n"
+        "Content-Type: %s\r\n"
+        "Content-Length: %d\r\n"
+        "Cookie: " + cookie + "\r\n"
+        "Date: %s\r\n"
+        "Max-Forward: 10\r\n"
+        "Pragma: no-cache\r\n"
+        "Proxy-Authorization: Basic dXNlcjpwYXNz\r\n"  # example base64
+        "Warning: 199 Miscellaneous warning\r\n"
+        "User-Agent: " + user_agent + "\r\n"
+        "\r\n"
+    )
+
+
+#: Filled with (Accept, Accept-Language, Authorization, Content-Type,
+#: Content-Length, Cookie, Date, User-Agent) in one %-format.
+_HEADER_TEMPLATE = _header_template()
+
+#: Request headers echoed back by the template, lower-cased.
+_ECHOED_HEADERS = frozenset(("accept", "accept-language", "authorization", "cookie", "user-agent"))
+
+#: Same header with the echoed fields preset to their defaults, for requests
+#: that carry none of them (API clients, health checks); filled with
+#: (Content-Type, Content-Length, Date) only.
+_DEFAULT_HEADER_TEMPLATE = _header_template(
+    accept="application/json",
+    language="en-US,en;q=0.9",
+    authorization="Basic <credentials>",
+    cookie="sessionid=xyz789", #dummy cookie
+    user_agent="Chrome/123.0.0.0",
+)
+
+#: (second, formatted Date header value); the value only changes once a
+#: second, so it is formatted at most that often. Replaced as a whole so
+#: threads never see a half-updated pair.
+_DATE_CACHE = (0, "")
+
+
+def _http_date():
+    """Return the current time as an RFC 7231 Date header value."""
+    global _DATE_CACHE
+    now = int(time.time())
+    cached = _DATE_CACHE
+    if cached[0] != now:
+        cached = _DATE_CACHE = (now, formatdate(now, usegmt=True))
+    return cached[1]
+
+#: A route hook result that is already final: ``body`` is bytes and ``headers``
+#: holds everything to send (Content-Type, CORS, ...). HttpAdapter passes it
+#: through without normalizing.
+PreparedResponse = namedtuple("PreparedResponse", ["status", "headers", "body"])
+
 class Response():   
     """The :class:`Response <Response>` object, which contains a
     server's response to an HTTP request.
@@ -58,22 +309,30 @@ class Response():
       <Response>
     """
 
-    __attrs__ = [
+    # Every attribute is declared up front: no per-instance __dict__, and
+    # attribute loads are slot lookups.
+    __slots__ = (
         "_content",
+        "_content_length",
+        "_static_stat",
+        "_content_consumed",
+        "_next",
         "_header",
         "status_code",
         "method",
         "headers",
         "url",
-        "history",
+        "_history",
         "encoding",
         "reason",
-        "cookies",
+        "_cookies",
         "elapsed",
         "request",
         "body",
-        "reason",
-    ]
+        "raw",
+        "connection",
+        "auth",
+    )
 
 
     def __init__(self, request=None):
@@ -84,8 +343,13 @@ class Response():
         """
 
         self._content = False
+        #: Body size; set from stat() when the body is not held in memory.
+        self._content_length = None
+        #: (path, stat result) left by open_static for build_content to reuse.
+        self._static_stat = None
         self._content_consumed = False
         self._next = None
+        self._header = None
 
         #: Integer Code of responded HTTP Status, e.g. 404 or 200.
         self.status_code = None
@@ -102,23 +366,69 @@ class Response():
         self.encoding = None
 
         #: A list of :class:`Response <Response>` objects from
-        #: the history of the Request.
-        self.history = []
+        #: the history of the Request (created on first access).
+        self._history = None
 
         #: Textual reason of responded HTTP Status, e.g. "Not Found" or "OK".
         self.reason = None
 
-        #: A of Cookies the response headers.
-        self.cookies = CaseInsensitiveDict()
+        #: A of Cookies the response headers (created on first access).
+        self._cookies = None
 
         #: The amount of time elapsed between sending the request
-        self.elapsed = datetime.timedelta(0)
+        self.elapsed = _NO_ELAPSED
 
         #: The :class:`PreparedRequest <PreparedRequest>` object to which this
         #: is a response.
         self.request = None
 
 
+    def reset(self):
+        """
+        Clear per-request state so the object can be reused for the next
+        response. The header dict is emptied, not replaced; cookies and
+        history are dropped and only recreated if used again.
+        """
+        self._content = False
+        self._content_length = None
+        self._static_stat = None
+        self._content_consumed = False
+        self._next = None
+        self._header = None
+        self.status_code = None
+        self.headers.clear()
+        self.url = None
+        self.encoding = None
+        self._history = None
+        self.reason = None
+        self._cookies = None
+        self.elapsed = _NO_ELAPSED
+        self.request = None
+
+
+    @property
+    def history(self):
+        """List of previous responses, created on first access."""
+        if self._history is None:
+            self._history = []
+        return self._history
+
+    @history.setter
+    def history(self, value):
+        self._history = value
+
+    @property
+    def cookies(self):
+        """Response cookies (CaseInsensitiveDict), created on first access."""
+        if self._cookies is None:
+            self._cookies = CaseInsensitiveDict()
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, value):
+        self._cookies = value
+
+
     def get_mime_type(self, path):
         """
         Determines the MIME type of a file based on its path.
@@ -129,10 +439,14 @@ class Response():
         """
 
         try:
-            mime_type, _ = mimetypes.guess_type(path)
+            ext = os.path.splitext(path)[1]
+            if ext in mimetypes.encodings_map or ext in mimetypes.suffix_map:
+                # e.g. ".tar.gz": the type comes from the inner suffix
+                mime_type, _ = mimetypes.guess_type(path)
+                return mime_type or 'application/octet-stream'
+            return _mime_for_ext(ext)
         except Exception:
             return 'application/octet-stream'
-        return mime_type or 'application/octet-stream'
 
 
     def prepare_content_type(self, mime_type='text/html'):
@@ -147,52 +461,13 @@ class Response():
         :raises ValueError: If the MIME type is unsupported.
         """
         
-        if not isinstance(mime_type, str) or '/' not in mime_type:
-            raise ValueError("Invalid MIME type format: {!r}".format(mime_type))
-
-        main_type, sub_type = mime_type.split('/', 1)
-        main_type, sub_type = main_type.strip().lower(), sub_type.strip().lower()
-        print("[Response] processing MIME main_type={} | sub_type={}".format(main_type, sub_type))
-
-        # Ensure headers dict exists
-        if not hasattr(self, "headers") or self.headers is None:
-            self.headers = {}
-
-        # Choose base directory via a mapping (override as needed)
-        # NOTE: Keep www/ for html, static/ for assets, apps/ for app bundles.
-        base_map = {
-            "text/html":     os.path.join(BASE_DIR, "www"),
-            "text/css":      os.path.join(BASE_DIR, "static"),
-            "text/plain":    os.path.join(BASE_DIR, "static"),
-            "text/javascript": os.path.join(BASE_DIR, "static"),
-            "application/javascript": os.path.join(BASE_DIR, "static"),
-            "image":         os.path.join(BASE_DIR, "static"),
-            "font":          os.path.join(BASE_DIR, "static"),
-            "audio":         os.path.join(BASE_DIR, "static"),
-            "video":         os.path.join(BASE_DIR, "static"),
-            # For app payloads served as files (e.g., zip, wasm):
-            "application":   os.path.join(BASE_DIR, "apps"),
-        }
-
-        # Decide base_dir
-        full = f"{main_type}/{sub_type}"
-        if full in base_map:
-            base_dir = base_map[full]
-        elif main_type in base_map:
-            base_dir = base_map[main_type]
-        else:
-            # Fallback to static for unknown types
-            base_dir = os.path.join(BASE_DIR, "static")
-
-        if main_type == "text":
-            self.headers["Content-Type"] = f"{full}; charset=utf-8"
-        elif main_type == "application" and sub_type in {"json", "xml"}:
-            self.headers["Content-Type"] = full
-        elif main_type in {"image", "audio", "video", "font"}:
-            self.headers["Content-Type"] = full
-        else:
-            self.headers["Content-Type"] = full or "application/octet-stream"
+        route = _MIME_ROUTES.get(mime_type)
+        if route is None:
+            route = _route_mime(mime_type)
+            if len(_MIME_ROUTES) < 256:
+                _MIME_ROUTES[mime_type] = route
 
+        base_dir, self.headers["Content-Type"] = route
         return base_dir
 
 
@@ -206,64 +481,66 @@ class Response():
         :rtype tuple: (int, bytes) representing content length and content data.
         """
 
-        filepath = os.path.join(base_dir, path.lstrip('/'))
+        filepath = _join_static(base_dir, path)
+        if filepath is None:
+            log.warning("rejected path outside %s: %s", base_dir, path)
+            return 0, b""
 
-        print("[Response] serving the object at location {}".format(filepath))
+        log.debug("serving the object at location %s", filepath)
         #fetch the object file 
         # Read file content
         try:
-            with open(filepath, 'rb') as f:
-                content = f.read()
+            cached = self._static_stat
+            st = cached[1] if cached is not None and cached[0] == filepath else None
+            content = _read_static(filepath, st)
             return len(content), content
         except Exception as e:
-            print("[Response] Error reading file: {}".format(e))
+            log.info("Error reading file: %s", e)
             return 0, b""
 
 
-    def build_response_header(self, request):
+    def build_response_header(self, request, content_length=None):
         """
         Constructs the HTTP response headers based on the class:`Request <Request>
         and internal attributes.
 
         :params request (class:`Request <Request>`): incoming request object.
+        :params content_length (int): body size; defaults to
+            ``self._content_length``, then to ``len(self._content)``.
 
         :rtypes bytes: encoded HTTP response header.
         """
+        if content_length is None:
+            content_length = self._content_length
+            if content_length is None:
+                content_length = len(self._content)
         reqhdr = request.headers
         rsphdr = self.headers
 
-        #Build dynamic headers
-        headers = {
-                "Accept": "{}".format(reqhdr.get("Accept", "application/json")),
-                "Accept-Language": "{}".format(reqhdr.get("Accept-Language", "en-US,en;q=0.9")),
-                "Authorization": "{}".format(reqhdr.get("Authorization", "Basic <credentials>")),
-                "Cache-Control": "no-cache",
-                "Content-Type": "{}".format(self.headers['Content-Type']),
-                "Content-Length": "{}".format(len(self._content)),
-                "Cookie": "{}".format(reqhdr.get("Cookie", "sessionid=xyz789")), #dummy cookie
         #
         # TODO prepare the request authentication
         #
         # self.auth = ...
-                "Date": "{}".format(datetime.datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")),
-                "Max-Forward": "10",
-                "Pragma": "no-cache",
-                "Proxy-Authorization": "Basic dXNlcjpwYXNz",  # example base64
-                "Warning": "199 Miscellaneous warning",
-                "User-Agent": "{}".format(reqhdr.get("User-Agent", "Chrome/123.0.0.0")),
-            }
-
-        #HTTP create header and body of response
-        # Build formatted HTTP header
-        fmt_header = "HTTP/1.1 200 OK\r\n"
-        
-        for key, value in headers.items():
-            fmt_header += "{}: {}\r\n".format(key, value)
-        
-        # Empty line to separate headers from body
-        fmt_header += "\r\n"
-        
-        return fmt_header.encode('utf-8')
+        store = getattr(reqhdr, "store", None)
+        if store is not None and _ECHOED_HEADERS.isdisjoint(store):
+            header = _DEFAULT_HEADER_TEMPLATE % (
+                rsphdr['Content-Type'], content_length, _http_date())
+            return header.encode('utf-8')
+
+        get = reqhdr.get
+        header = _HEADER_TEMPLATE % (
+            get("Accept", "application/json"),
+            get("Accept-Language", "en-US,en;q=0.9"),
+            get("Authorization", "Basic <credentials>"),
+            rsphdr['Content-Type'],
+            content_length,
+            get("Cookie", "sessionid=xyz789"), #dummy cookie
+            _http_date(),
+            get("User-Agent", "Chrome/123.0.0.0"),
+        )
+
+        # utf-8, not ascii: request headers are echoed back verbatim
+        return header.encode('utf-8')
 
 
     def build_notfound(self):
@@ -273,16 +550,123 @@ class Response():
         :rtype bytes: Encoded 404 response.
         """
 
-        return (
-                "HTTP/1.1 404 Not Found\r\n"
-                "Accept-Ranges: bytes\r\n"
-                "Content-Type: text/html\r\n"
-                "Content-Length: 13\r\n"
-                "Cache-Control: max-age=86000\r\n"
-                "Connection: close\r\n"
-                "\r\n"
-                "404 Not Found"
-            ).encode('utf-8')
+        return _NOTFOUND_BYTES
+
+
+    def resolve_static(self, request):
+        """
+        Map the request path to the file that :meth:`build_response` would serve,
+        preparing the Content-Type header on the way.
+
+        :params request (class:`Request <Request>`): incoming request object.
+
+        :rtype str: file path, or None if the MIME type is unsupported or the
+            path escapes the base directory.
+        """
+        try:
+            base_dir = self.prepare_content_type(mime_type=self.get_mime_type(request.path))
+        except ValueError:
+            return None
+        return _join_static(base_dir, request.path)
+
+
+    def open_static(self, request, min_size=0):
+        """
+        Open the static file for ``request`` if it is a regular file of at
+        least ``min_size`` bytes, preparing the Content-Type header and
+        ``_content_length`` from fstat() without reading the file. Smaller
+        files are only stat()ed, and the result is kept for
+        :meth:`build_content`.
+
+        :rtype tuple: (fd, size), or None if the caller should fall back to
+            :meth:`build_response`. The caller closes ``fd``.
+        """
+        path = self.resolve_static(request)
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode) or st.st_size < min_size:
+            self._static_stat = (path, st)
+            return None
+        try:
+            fd = _open_readonly(path)
+        except OSError:
+            return None
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode) or st.st_size < min_size:
+            os.close(fd)
+            return None
+        self._content_length = st.st_size
+        return fd, st.st_size
+
+
+    def sendfile_response(self, sock, request, min_size=0):
+        """
+        Serve the static file for ``request`` with sendfile(2): only the
+        header block is built in Python, the file content goes from the page
+        cache to the socket without passing through user space.
+
+        :params sock (socket.socket): blocking client socket.
+        :params request (class:`Request <Request>`): incoming request object.
+        :params min_size (int): leave files smaller than this to
+            :meth:`build_response`.
+
+        :rtype bool: True if the response was sent, False if the caller
+            should fall back to :meth:`build_response` (also when the
+            platform has no ``os.sendfile``).
+        """
+        if not hasattr(os, "sendfile"):
+            return False
+        opened = self.open_static(request, min_size)
+        if opened is None:
+            return False
+        fd, size = opened
+        try:
+            sock.sendall(self.build_response_header(request))
+            out, offset = sock.fileno(), 0
+            while offset < size:
+                sent = os.sendfile(out, fd, offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+            return True
+        finally:
+            os.close(fd)
+
+
+    def iter_content(self, fileobj, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Yield the content of a binary file object in ``chunk_size`` blocks.
+        """
+        read = fileobj.read
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+    def stream_response(self, conn, request, min_size=0):
+        """
+        Like :meth:`sendfile_response` for connections without sendfile():
+        the file is written in :data:`STREAM_CHUNK_SIZE` blocks, so memory use
+        stays constant whatever the file size.
+
+        :rtype bool: True if the response was sent, False if the caller
+            should fall back to :meth:`build_response`.
+        """
+        opened = self.open_static(request, min_size)
+        if opened is None:
+            return False
+        fd, size = opened
+        with open(fd, "rb", buffering=0) as f:
+            conn.sendall(self.build_response_header(request))
+            for chunk in self.iter_content(f):
+                conn.sendall(chunk)
+        return True
 
 
     def build_response(self, request):
@@ -293,32 +677,44 @@ class Response():
 
         :rtype bytes: complete HTTP response using prepared headers and content.
         """
+        return b"".join(self.build_response_parts(request))
+
+
+    def build_response_parts(self, request):
+        """
+        Same as :meth:`build_response`, but returns the encoded header block and
+        the content separately so they can be written without concatenating.
+
+        :params request (class:`Request <Request>`): incoming request object.
+
+        :rtype tuple: (header bytes, content bytes).
+        """
 
         path = request.path
 
         mime_type = self.get_mime_type(path)
-        print("[Response] Method: {} | path: {} | mime_type {}".format(request.method, request.path, mime_type))
+        log.debug("Method: %s | path: %s | mime_type %s", request.method, request.path, mime_type)
 
         base_dir = ""
 
         #If HTML, parse and serve embedded objects
         try:
             base_dir = self.prepare_content_type(mime_type=mime_type)
-        except ValueError:
-            print("[Response] Error preparing content type: {}".format(e))
-            return self.build_notfound()
+        except ValueError as e:
+            log.info("Error preparing content type: %s", e)
+            return self.build_notfound(), b""
 
-        print("[Response] base_dir {}".format(base_dir))
-        print("[Response] path {}".format(path))
+        log.debug("base_dir %s | path %s", base_dir, path)
 
         c_len, self._content = self.build_content(path, base_dir)
+        self._content_length = c_len
 
         if c_len <= 0:
-            return self.build_notfound()
+            return self.build_notfound(), b""
 
         self._header = self.build_response_header(request)
 
-        return self._header + self._content
+        return self._header, self._content
 
 
     def compose(self, status: str = "200 OK", headers: dict | None = None, body: bytes | str = b""):
@@ -326,19 +722,26 @@ class Response():
         Build a full HTTP response bytes from status, headers and body.
         This keeps one unified way to return responses from handlers.
         """
-        headers = headers or {}
+        return b"".join(self.compose_parts(status, headers, body))
+
+    def compose_parts(self, status: str = "200 OK", headers: dict | None = None, body: bytes | str = b""):
+        """
+        Like :meth:`compose`, but return ``(head, body)`` with the status line and
+        headers encoded and the body left untouched, so callers can hand both
+        buffers to the socket without copying the body.
+        """
         # Normalize body into bytes
         if isinstance(body, str):
             body = body.encode("utf-8", "ignore")
 
         # Ensure essential headers
+        headers = dict(headers or {})
         if "Content-Length" not in headers:
             headers["Content-Length"] = str(len(body))
         if "Connection" not in headers:
             headers["Connection"] = "close"
 
-        # Status-Line + headers
-        status_line = f"HTTP/1.1 {status}\r\n"
-        head = status_line + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+        # Status-Line + headers, joined in one pass
+        head = "".join([f"HTTP/1.1 {status}\r\n", *[f"{k}: {v}\r\n" for k, v in headers.items()], "\r\n"])
 
-        return head.encode("utf-8") + body
\ No newline at end of file
+        return head.encode("utf-8"), body
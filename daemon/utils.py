@@ -10,9 +10,48 @@
 # while attending the course
 #
 
-from urllib.parse import parse_qs, urlparse, unquote
+from urllib.parse import urlparse, unquote, unquote_plus
 import json 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def json_dumps(obj):
+        """Serialize ``obj`` to a JSON str (orjson backend)."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+else:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj):
+        """Serialize ``obj`` to UTF-8 JSON bytes (stdlib backend)."""
+        return json.dumps(obj).encode("utf-8")
+
+#: Bodies larger than this are not parsed by parse_form_or_json.
+MAX_FORM_BODY = 65536
+
+def _parse_form(raw_body):
+    """
+    Split an ``a=1&b=2`` form body into a dict. Same result as
+    ``parse_qs(raw_body, keep_blank_values=True)`` with the first value of
+    each key kept, without building the per-key lists.
+    """
+    out = {}
+    for pair in raw_body.split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        key = unquote_plus(key)
+        if key not in out:
+            out[key] = unquote_plus(value)
+    return out
+
 def parse_form_or_json(raw_body):
     """
     - JSON:
@@ -22,35 +61,45 @@ def parse_form_or_json(raw_body):
         }
     - form-url-encoded:
         username=admin&password=password
-    Return: dict {"username": "...", "password": "..."}.
+    Return: dict {"username": "...", "password": "..."}, or {} for bodies
+    over MAX_FORM_BODY.
     """
 
-    if raw_body is None:
+    if not isinstance(raw_body, (str, bytes, bytearray)):
         return {}
 
-    # bytes -> str
-    if isinstance(raw_body, (bytes, bytearray)):
-        raw_body = raw_body.decode("utf-8", "ignore")
-
-    if not isinstance(raw_body, str):
-        return {}
-    raw_body = raw_body.lstrip("\ufeff").strip()
-    if not raw_body or raw_body == "anonymous":
+    # Login-sized payloads only; don't decode or copy an oversized body
+    if len(raw_body) > MAX_FORM_BODY:
         return {}
 
-    looks_like_form = (
-        ("=" in raw_body) and
-        not raw_body.lstrip().startswith("{")
-    )
-
-    if looks_like_form:
-        parsed = parse_qs(raw_body, keep_blank_values=True)
-        return {k: v[0] if v else "" for k, v in parsed.items()}
+    if isinstance(raw_body, str):
+        raw_body = raw_body.lstrip("\ufeff").strip()
+        if not raw_body or raw_body == "anonymous":
+            return {}
+        if "=" in raw_body and not raw_body.startswith("{"):
+            return _parse_form(raw_body)
+    else:
+        # Stay on bytes: the JSON parser decodes them itself, only the
+        # form branch needs a str
+        raw_body = raw_body.strip()
+        if raw_body.startswith(b"\xef\xbb\xbf"):
+            raw_body = raw_body[3:].lstrip()
+        if not raw_body or raw_body == b"anonymous":
+            return {}
+        if b"=" in raw_body and not raw_body.startswith(b"{"):
+            return _parse_form(raw_body.decode("utf-8", "ignore"))
 
     try:
-        return json.loads(raw_body)
+        return json_loads(raw_body)
     except Exception:
-        return {}
+        pass
+    if not isinstance(raw_body, str):
+        # Invalid UTF-8 inside the JSON: retry with the lenient decode
+        try:
+            return json_loads(raw_body.decode("utf-8", "ignore"))
+        except Exception:
+            pass
+    return {}
 
 def get_auth_from_url(url):
     parsed = urlparse(url)
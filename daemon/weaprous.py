@@ -17,7 +17,10 @@ deamon.weaproute
 This module provides a WeApRous object to deploy RESTful url web app with routing
 """
 
+import functools
+
 from .backend import create_backend
+from .utils import json_dumps, json_loads
 
 class WeApRous:
     """The fully mutable :class:`WeApRous <WeApRous>` object, which is a lightweight,
@@ -64,18 +67,22 @@ class WeApRous:
         self.ip = ip
         self.port = port
 
-    def route(self, path, methods=['GET']):
+    def route(self, path, methods=['GET'], parse_json=False):
         """
         Decorator to register a route handler for a specific path and HTTP methods.
 
         :param path (str): The URL path to route.
         :param methods (list): A list of HTTP methods (e.g., ['GET', 'POST']) to bind.
+        :param parse_json (bool): Decode the request body as JSON before calling
+            the handler, which then receives a dict (``{}`` for an empty body).
+            Invalid JSON is answered with a JSON error without calling it.
 
         :rtype: function - A decorator that registers the handler function.
         """
         def decorator(func):
+            handler = self._json_body(func) if parse_json else func
             for method in methods:
-                self.routes[(method.upper(), path)] = func
+                self.routes[(method.upper(), path)] = handler
 
             # Optional attach route metadata to the function
             func._route_path = path
@@ -84,18 +91,41 @@ class WeApRous:
             return func
         return decorator
 
-    def run(self):
+    @staticmethod
+    def _json_body(func):
+        """Wrap ``func`` so it is called with the request body decoded as JSON."""
+        @functools.wraps(func)
+        def handler(headers="guest", body="anonymous"):
+            if body and body != "anonymous":
+                try:
+                    body = json_loads(body)
+                except ValueError as e:
+                    return json_dumps({"status": "error", "message": str(e)})
+            else:
+                body = {}
+            return func(headers=headers, body=body)
+        return handler
+
+    def run(self, use_asyncio=False, processes=1):
         """
         Start the backend server and begin handling requests.
 
         This method launches the TCP server using the configured IP and port,
         and dispatches incoming requests to the registered route handlers.
 
+        :param use_asyncio (bool): Read requests on one asyncio event loop
+            and answer them from a small thread pool, instead of a thread
+            per connection.
+        :param processes (int): Number of worker processes sharing the port
+            through SO_REUSEPORT. Each has its own copy of module state, so
+            keep 1 for apps whose handlers store anything between requests.
+
         :raise: Error if IP or port has not been configured.
         """
         if not self.ip or not self.port:
             print("Rous app need to preapre address"
                   "by calling app.prepare_address(ip,port)")
 
-        create_backend(self.ip, self.port, self.routes)
+        create_backend(self.ip, self.port, self.routes,
+                       use_asyncio=use_asyncio, processes=processes)
         
@@ -26,12 +26,320 @@ Each peer can:
 - Broadcast messages to all connected peers
 """
 
+import os
 import socket
+import http.client
+import selectors
+import struct
 import json
+import queue
+import logging
+import logging.handlers
 import threading
 import argparse
-import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+
+def configure_logging(level="INFO"):
+    """
+    Send log records to stderr from a background thread: callers only put
+    the record on a queue, so peer threads never wait on the stream's I/O
+    lock. Returns the QueueListener; stop() it to flush before exiting.
+    """
+    records = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(records, handler)
+    
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    root.addHandler(logging.handlers.QueueHandler(records))
+    listener.start()
+    return listener
+
+
+
+# Linux only; the kernel drops back to delayed ACKs after a while, so it is
+# re-armed after every receive (see _recv)
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
+
+#: SO_SNDBUF/SO_RCVBUF for peer and tracker sockets, from
+#: WEAPROUS_PEER_SOCKBUF (bytes). 0 keeps the kernel's buffer autotuning,
+#: which is right for chat-sized messages; for wide broadcast fan-out on
+#: high bandwidth-delay links set it to about the BDP (e.g. 4194304) and
+#: raise net.core.rmem_max / net.core.wmem_max to match, since Linux
+#: silently caps the request at those limits.
+SOCKET_BUFFER_SIZE = int(os.environ.get("WEAPROUS_PEER_SOCKBUF", "0") or 0)
+
+
+def _tune_socket(sock):
+    """
+    Disable Nagle's algorithm on a peer or tracker socket: every exchange
+    is a small JSON message followed by a wait for the reply, which Nagle
+    would hold back until the previous segment is ACKed. Where available,
+    also ACK immediately instead of waiting for the delayed-ACK timer.
+    Call it before bind()/connect() so explicit buffer sizes take part in
+    the window-scale negotiation.
+    """
+    try:
+        if SOCKET_BUFFER_SIZE > 0:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if _TCP_QUICKACK is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+    except OSError:
+        pass
+
+
+def _recv(sock, size):
+    """recv() from ``sock``, re-enabling TCP_QUICKACK afterwards."""
+    data = sock.recv(size)
+    if _TCP_QUICKACK is not None and data:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        except OSError:
+            pass
+    return data
+
+
+def _recv_into(sock, buffer):
+    """recv_into() for ``sock``, re-enabling TCP_QUICKACK afterwards."""
+    n = sock.recv_into(buffer)
+    if _TCP_QUICKACK is not None and n:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        except OSError:
+            pass
+    return n
+
+
+# Encoder/decoder for peer messages: bytes out, bytes-like in
+if orjson is not None:
+    _dump_message = orjson.dumps
+    _load_message = orjson.loads
+else:
+    def _dump_message(obj):
+        """Serialize ``obj`` to UTF-8 JSON bytes (stdlib backend)."""
+        return json.dumps(obj).encode('utf-8')
+    
+    def _load_message(data):
+        """Parse UTF-8 JSON from a bytes-like object (stdlib backend)."""
+        return json.loads(bytes(data))
+
+
+# Peer messages are framed as a 4-byte big-endian payload length and a
+# 1-byte message type tag, followed by the UTF-8 JSON payload, so TCP may
+# split or coalesce them freely and the receiver can route a message
+# before (or without) parsing it.
+_FRAME_HEADER = struct.Struct("!IB")
+TAG_HANDSHAKE = ord("H")
+TAG_HANDSHAKE_ACK = ord("A")
+TAG_CHAT = ord("C")
+TAG_BROADCAST = ord("B")
+#: Tags whose payload is parsed; frames with any other tag are skipped.
+_KNOWN_TAGS = frozenset((TAG_HANDSHAKE, TAG_HANDSHAKE_ACK, TAG_CHAT, TAG_BROADCAST))
+#: Larger frames are treated as a protocol error and drop the connection.
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+#: Initial receive buffer per peer connection; grows for larger frames.
+STREAM_BUFFER_SIZE = 65536
+
+
+def _frame(tag, obj):
+    """Encode ``obj`` as a complete frame, ready for sendall()."""
+    payload = _dump_message(obj)
+    return _FRAME_HEADER.pack(len(payload), tag) + payload
+
+
+def _send_many(sock, buffers):
+    """
+    Write ``buffers`` back to back as one gather write (sendmsg), so a
+    message split over several buffers leaves in as few segments as one
+    joined buffer would, without copying the parts together. Platforms
+    without sendmsg() get a single sendall() of the joined buffers.
+    """
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(buffers))
+        return
+    views = [memoryview(b) for b in buffers]
+    first = 0
+    while first < len(views):
+        sent = sock.sendmsg(views[first:])
+        # Skip what went out; a partial write resumes mid-buffer
+        while first < len(views) and sent >= len(views[first]):
+            sent -= len(views[first])
+            first += 1
+        if sent:
+            views[first] = views[first][sent:]
+
+
+def _send_frame(sock, tag, obj):
+    """Send ``obj`` as one framed JSON message, in a single write."""
+    payload = _dump_message(obj)
+    _send_many(sock, (_FRAME_HEADER.pack(len(payload), tag), payload))
+
+
+def _recv_exact(sock, size):
+    """Read exactly ``size`` bytes from ``sock``; None if it closes first."""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = _recv(sock, size - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_frame(sock):
+    """
+    Blocking read of one framed message.
+    
+    :return: (tag, message), or (None, None) if the peer closed
+    """
+    header = _recv_exact(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None, None
+    size, tag = _FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError("frame too large: {} bytes".format(size))
+    payload = _recv_exact(sock, size)
+    if payload is None:
+        return None, None
+    return tag, _load_message(payload)
+
+
+#: Messages kept in the history, overall and per channel; older ones are
+#: dropped.
+MESSAGE_HISTORY = 10000
+
+
+#: Size of the worker pool that runs connect_peer() calls for join_channel.
+MAX_CONNECT_WORKERS = 32
+
+
+#: Seconds to wait for the tracker to connect or answer.
+TRACKER_TIMEOUT = 5.0
+
+
+#: Seconds a send to a peer (or its connect and handshake) may block
+#: before the peer is given up on.
+PEER_SEND_TIMEOUT = 5.0
+
+
+def _coerce_msg(message, default_channel):
+    """
+    Build the stored form of a received chat or broadcast message. The
+    receive time is only taken when the sender did not stamp it.
+    """
+    get = message.get
+    return {
+        "from": get("from", "unknown"),
+        "channel": get("channel", default_channel),
+        "message": get("message", ""),
+        "time": get("time") or datetime.now().isoformat()
+    }
+
+
+class _TrackerConnection(http.client.HTTPConnection):
+    """HTTPConnection whose socket gets the same tuning as peer sockets."""
+    
+    def connect(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        _tune_socket(sock)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect((self.host, self.port))
+        except Exception:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+#: An open P2P connection. ``send_lock`` keeps concurrent senders from
+#: interleaving their bytes on ``sock``; it is never held while waiting on
+#: another peer.
+PeerConn = namedtuple("PeerConn", ["sock", "send_lock"])
+
+
+class _PeerStream:
+    """
+    Event loop state of one peer connection. Data is received with
+    recv_into() into a reusable buffer and messages are decoded from
+    views of it, so a steady stream of frames allocates no bytes objects.
+    """
+    
+    __slots__ = ("username", "buf", "view", "start", "end")
+    
+    def __init__(self, username):
+        #: Peer username, None until an incoming connection's handshake
+        self.username = username
+        #: Receive buffer; buf[start:end] holds bytes not yet consumed
+        self.buf = bytearray(STREAM_BUFFER_SIZE)
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+    
+    def recv_from(self, sock):
+        """Receive into the free end of ``buf``. Returns 0 on EOF."""
+        if self.end == len(self.buf):
+            pending = self.end - self.start
+            if self.start:
+                # Move the partial frame to the front
+                self.buf[:pending] = self.buf[self.start:self.end]
+            else:
+                # A single frame bigger than the buffer
+                self._resize(2 * len(self.buf))
+            self.start = 0
+            self.end = pending
+        n = _recv_into(sock, self.view[self.end:])
+        self.end += n
+        return n
+    
+    def messages(self):
+        """
+        Yield (tag, message) for each complete frame in the buffer. Frames
+        with an unknown tag are skipped without parsing their payload.
+        """
+        header = _FRAME_HEADER.size
+        while self.end - self.start >= header:
+            size, tag = _FRAME_HEADER.unpack_from(self.buf, self.start)
+            if size > MAX_FRAME_SIZE:
+                raise ValueError("frame too large: {} bytes".format(size))
+            stop = self.start + header + size
+            if stop > self.end:
+                break
+            if tag not in _KNOWN_TAGS:
+                self.start = stop
+                continue
+            with self.view[self.start + header:stop] as payload:
+                message = _load_message(payload)
+            self.start = stop
+            yield tag, message
+        
+        if self.start == self.end:
+            self.start = self.end = 0
+            if len(self.buf) > STREAM_BUFFER_SIZE:
+                self._resize(STREAM_BUFFER_SIZE)
+    
+    def _resize(self, size):
+        # A bytearray cannot be resized while a view of it exists
+        self.view.release()
+        if size > len(self.buf):
+            self.buf.extend(bytes(size - len(self.buf)))
+        else:
+            del self.buf[size:]
+        self.view = memoryview(self.buf)
 
 
 class PeerClient:
@@ -58,22 +366,59 @@ class PeerClient:
         self.tracker_ip = tracker_ip
         self.tracker_port = tracker_port
         
-        # P2P connections
-        self.peer_connections = {}  # {username: socket}
+        # Handshake frames only depend on the username; build them once
+        self._handshake_frame = _frame(TAG_HANDSHAKE, {
+            "type": "handshake",
+            "username": username
+        })
+        self._handshake_ack_frame = _frame(TAG_HANDSHAKE_ACK, {
+            "type": "handshake_ack",
+            "username": username,
+            "status": "connected"
+        })
+        
+        # P2P connections. Copy-on-write: never mutated in place, but
+        # replaced under connections_lock, so readers need no lock
+        self.peer_connections = MappingProxyType({})  # {username: PeerConn}
         self.peer_info = {}  # {username: {"ip": str, "port": int}}
         
         # Channels this peer has joined
         self.channels = []
         
-        # Message history
-        self.messages = []  # [{"from": str, "channel": str, "message": str, "time": str}]
+        # Message history, newest last
+        self.messages = deque(maxlen=MESSAGE_HISTORY)  # [{"from": str, "channel": str, "message": str, "time": str}]
+        self.messages_by_channel = {}  # {channel: deque of the same dicts}
         
-        # Thread locks
+        # Thread locks; connections_lock serialises replacing
+        # peer_connections, sends use the per-peer PeerConn.send_lock
         self.connections_lock = threading.Lock()
         self.messages_lock = threading.Lock()
         
+        # Keep-alive connection to the tracker, used by one request at a
+        # time; it reconnects by itself after the tracker closes it
+        self._tracker_http = _TrackerConnection(
+            tracker_ip, tracker_port, timeout=TRACKER_TIMEOUT)
+        self._tracker_lock = threading.Lock()
+        # Fixed headers of every tracker request; with Host given,
+        # http.client does not format its own
+        self._tracker_headers = {
+            "Host": "{}:{}".format(tracker_ip, tracker_port),
+            "Content-Type": "application/json"
+        }
+        
+        # Threads for outgoing connects, started on demand and reused
+        # across join_channel calls
+        self._workers = ThreadPoolExecutor(
+            max_workers=MAX_CONNECT_WORKERS, thread_name_prefix="peer")
+        
         # Server socket for accepting incoming P2P connections
         self.server_socket = None
+        # Readiness of the server socket and all peer sockets
+        self._selector = selectors.DefaultSelector()
+        # stop() writes a byte here to wake the event loop
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
         self.running = False
     
     
@@ -81,25 +426,35 @@ class PeerClient:
         """Start the peer client - begin listening for P2P connections."""
         self.running = True
         
-        # Start P2P server thread
+        # Start the P2P event loop thread (accepts and reads all peers)
         server_thread = threading.Thread(target=self._run_p2p_server)
         server_thread.daemon = True
         server_thread.start()
         
-        print("[Peer] Started P2P server on {}:{}".format(self.peer_ip, self.peer_port))
+        log.info("[Peer] Started P2P server on %s:%s", self.peer_ip, self.peer_port)
     
     
     def stop(self):
         """Stop the peer client."""
         self.running = False
         
+        # Wake the event loop so it exits now
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            pass
+        
         # Close all peer connections
-        with self.connections_lock:
-            for username, conn in self.peer_connections.items():
-                try:
-                    conn.close()
-                except:
-                    pass
+        for username, pc in self.peer_connections.items():
+            try:
+                pc.sock.close()
+            except:
+                pass
+        
+        with self._tracker_lock:
+            self._tracker_http.close()
+        
+        self._workers.shutdown(wait=False)
         
         # Close server socket
         if self.server_socket:
@@ -108,175 +463,253 @@ class PeerClient:
             except:
                 pass
         
-        print("[Peer] Stopped")
+        log.info("[Peer] Stopped")
     
     
     def _run_p2p_server(self):
-        """Run P2P server to accept incoming connections from other peers."""
+        """
+        Run the P2P event loop: one thread accepts incoming connections and
+        reads from every connected peer, inbound or outbound, as the
+        selector reports them readable. Sockets are used in blocking style,
+        bounded by PEER_SEND_TIMEOUT, so senders on other threads can use
+        sendall(); they are only read when data is already waiting.
+        """
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            _tune_socket(self.server_socket)
             self.server_socket.bind((self.peer_ip, self.peer_port))
             self.server_socket.listen(10)
+            self._selector.register(self.server_socket, selectors.EVENT_READ, None)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
             
-            print("[Peer] Listening for P2P connections on {}:{}".format(
-                self.peer_ip, self.peer_port))
-            
-            while self.running:
-                try:
-                    # Set timeout to periodically check self.running
-                    self.server_socket.settimeout(1.0)
-                    conn, addr = self.server_socket.accept()
-                    
-                    # Handle new peer connection in separate thread
-                    handler_thread = threading.Thread(
-                        target=self._handle_peer_connection,
-                        args=(conn, addr)
-                    )
-                    handler_thread.daemon = True
-                    handler_thread.start()
-                    
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        print("[Peer] Error accepting connection: {}".format(e))
+            log.info("[Peer] Listening for P2P connections on %s:%s",
+                     self.peer_ip, self.peer_port)
         
         except Exception as e:
-            print("[Peer] Error starting P2P server: {}".format(e))
+            log.warning("[Peer] Error starting P2P server: %s", e)
+            self._selector.close()
+            self._wakeup_r.close()
+            self._wakeup_w.close()
+            return
+        
+        try:
+            while self.running:
+                # Blocks until a socket is readable or stop() wakes us
+                for key, _ in self._selector.select():
+                    if key.data is not None:
+                        self._on_peer_readable(key.fileobj, key.data)
+                    elif key.fileobj is self.server_socket:
+                        self._accept_peer()
+                    else:
+                        break
+        except Exception as e:
+            if self.running:
+                log.warning("[Peer] Error in P2P event loop: %s", e)
+        finally:
+            self._selector.close()
+            self._wakeup_r.close()
+            self._wakeup_w.close()
+    
+    
+    def _accept_peer(self):
+        """Accept one incoming connection and watch it for its handshake."""
+        try:
+            conn, addr = self.server_socket.accept()
+        except OSError as e:
+            if self.running:
+                log.warning("[Peer] Error accepting connection: %s", e)
+            return
+        self._handle_peer_connection(conn, addr)
     
     
     def _handle_peer_connection(self, conn, addr):
         """
-        Handle incoming P2P connection from another peer.
+        Register an incoming P2P connection with the event loop. Its first
+        message is expected to be the handshake (see _on_peer_readable).
         
         :param conn (socket): Connection socket
         :param addr (tuple): Address of the connecting peer
         """
-        print("[Peer] New P2P connection from {}".format(addr))
+        log.debug("[Peer] New P2P connection from %s", addr)
+        _tune_socket(conn)
+        self._watch_peer(conn, _PeerStream(None))
+    
+    
+    def _watch_peer(self, conn, stream):
+        """
+        Have the event loop read ``conn`` from now on. Sends get
+        PEER_SEND_TIMEOUT, so a peer that stops reading cannot hold its
+        send_lock (or the event loop, for the handshake ack) forever.
+        """
+        try:
+            conn.settimeout(PEER_SEND_TIMEOUT)
+            self._selector.register(conn, selectors.EVENT_READ, stream)
+        except (ValueError, KeyError, OSError) as e:
+            log.warning("[Peer] Cannot watch connection: %s", e)
+            conn.close()
+    
+    
+    def _on_peer_readable(self, conn, stream):
+        """
+        Read what a peer sent and handle every complete message in it.
         
+        :param conn (socket): Connection socket
+        :param stream (_PeerStream): Event loop state for the connection
+        """
         try:
-            # Receive handshake message
-            data = conn.recv(4096).decode('utf-8')
-            
-            if not data:
-                conn.close()
+            if not stream.recv_from(conn):
+                self._drop_peer(conn, stream.username)
                 return
             
-            message = json.loads(data)
-            msg_type = message.get("type", "")
+            for tag, message in stream.messages():
+                if not self._handle_peer_frame(conn, stream, tag, message):
+                    return
+        
+        except Exception as e:
+            log.warning("[Peer] Error receiving from %s: %s", stream.username, e)
+            self._drop_peer(conn, stream.username)
+    
+    
+    def _handle_peer_frame(self, conn, stream, tag, message):
+        """
+        Handle one message from a peer. For a connection that has not
+        identified itself yet this is the handshake, or a one-off direct
+        message after which the connection is closed.
+        
+        :return: bool - False if the connection was closed
+        """
+        if stream.username is not None:
+            self._process_peer_message(tag, message)
+            return True
+        
+        if tag == TAG_HANDSHAKE:
+            # Peer identification
+            peer_username = message.get("username", "unknown")
             
-            if msg_type == "handshake":
-                # Peer identification
-                peer_username = message.get("username", "unknown")
-                
-                print("[Peer] Handshake from peer: {}".format(peer_username))
-                
-                # Store connection
-                with self.connections_lock:
-                    self.peer_connections[peer_username] = conn
-                
-                # Send handshake response
-                response = {
-                    "type": "handshake_ack",
-                    "username": self.username,
-                    "status": "connected"
-                }
-                conn.sendall(json.dumps(response).encode('utf-8'))
-                
-                # Continue listening for messages from this peer
-                self._listen_to_peer(conn, peer_username)
+            log.debug("[Peer] Handshake from peer: %s", peer_username)
             
-            else:
-                # Handle direct message
-                self._process_peer_message(message)
-                conn.close()
+            # Send handshake response before the connection is published,
+            # so no chat message can overtake the ack
+            conn.sendall(self._handshake_ack_frame)
+            
+            # Store connection
+            with self.connections_lock:
+                self._publish_peer(peer_username, PeerConn(conn, threading.Lock()))
+            stream.username = peer_username
+            return True
         
-        except Exception as e:
-            print("[Peer] Error handling peer connection: {}".format(e))
+        # Handle direct message
+        self._process_peer_message(tag, message)
+        self._drop_peer(conn, None)
+        return False
+    
+    
+    def _publish_peer(self, peer_username, pc):
+        """
+        Add or replace a connection in peer_connections.
+        Call with connections_lock held.
+        """
+        conns = dict(self.peer_connections)
+        conns[peer_username] = pc
+        self.peer_connections = MappingProxyType(conns)
+    
+    
+    def _unpublish_peers(self, entries):
+        """
+        Remove (username, PeerConn) entries from peer_connections, skipping
+        any that were replaced by a newer connection in the meantime.
+        Call with connections_lock held.
+        """
+        current = self.peer_connections
+        conns = None
+        for peer_username, pc in entries:
+            if current.get(peer_username) is pc:
+                if conns is None:
+                    conns = dict(current)
+                del conns[peer_username]
+        if conns is not None:
+            self.peer_connections = MappingProxyType(conns)
+    
+    
+    def _abandon_peers(self, entries):
+        """
+        Give up on (username, PeerConn) entries whose send failed or timed
+        out: unpublish them in one copy, and shut the sockets down so the
+        event loop sees EOF and finishes the cleanup.
+        """
+        with self.connections_lock:
+            self._unpublish_peers(entries)
+        for peer_username, pc in entries:
             try:
-                conn.close()
-            except:
+                pc.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
                 pass
     
     
-    def _listen_to_peer(self, conn, peer_username):
+    def _drop_peer(self, conn, peer_username):
         """
-        Continuously listen for messages from a connected peer.
+        Stop watching ``conn``, forget it and close it.
         
         :param conn (socket): Connection socket
-        :param peer_username (str): Username of the peer
+        :param peer_username (str): Username of the peer, None before handshake
         """
         try:
-            while self.running:
-                conn.settimeout(1.0)
-                try:
-                    data = conn.recv(4096).decode('utf-8')
-                    
-                    if not data:
-                        break
-                    
-                    message = json.loads(data)
-                    self._process_peer_message(message)
-                
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    print("[Peer] Error receiving from {}: {}".format(peer_username, e))
-                    break
+            self._selector.unregister(conn)
+        except (KeyError, ValueError):
+            pass
         
-        finally:
-            # Remove connection
-            with self.connections_lock:
-                if peer_username in self.peer_connections:
-                    del self.peer_connections[peer_username]
-            
-            try:
-                conn.close()
-            except:
-                pass
-            
-            print("[Peer] Disconnected from peer: {}".format(peer_username))
+        # Remove connection, unless it was already replaced by a newer one
+        if peer_username is not None:
+            pc = self.peer_connections.get(peer_username)
+            if pc is not None and pc.sock is conn:
+                with self.connections_lock:
+                    self._unpublish_peers([(peer_username, pc)])
+        
+        try:
+            conn.close()
+        except:
+            pass
+        
+        if peer_username is not None:
+            log.debug("[Peer] Disconnected from peer: %s", peer_username)
     
     
-    def _process_peer_message(self, message):
+    def _store_message(self, msg_data):
+        """Append a received message to the overall and channel history."""
+        channel = msg_data["channel"]
+        with self.messages_lock:
+            self.messages.append(msg_data)
+            history = self.messages_by_channel.get(channel)
+            if history is None:
+                history = self.messages_by_channel[channel] = deque(maxlen=MESSAGE_HISTORY)
+            history.append(msg_data)
+    
+    
+    def _process_peer_message(self, tag, message):
         """
         Process received message from peer.
         
+        :param tag (int): Frame type tag (TAG_*)
         :param message (dict): Message data
         """
-        msg_type = message.get("type", "")
-        
-        if msg_type == "chat":
+        if tag == TAG_CHAT:
             # Store message
-            msg_data = {
-                "from": message.get("from", "unknown"),
-                "channel": message.get("channel", "direct"),
-                "message": message.get("message", ""),
-                "time": message.get("time", datetime.now().isoformat())
-            }
+            msg_data = _coerce_msg(message, "direct")
+            self._store_message(msg_data)
             
-            with self.messages_lock:
-                self.messages.append(msg_data)
-            
-            print("[Peer] Message from {}: {}".format(
-                msg_data["from"], msg_data["message"]))
+            log.debug("[Peer] Message from %s: %s",
+                      msg_data["from"], msg_data["message"])
         
-        elif msg_type == "broadcast":
+        elif tag == TAG_BROADCAST:
             # Handle broadcast message
-            msg_data = {
-                "from": message.get("from", "unknown"),
-                "channel": message.get("channel", "broadcast"),
-                "message": message.get("message", ""),
-                "time": message.get("time", datetime.now().isoformat())
-            }
-            
-            with self.messages_lock:
-                self.messages.append(msg_data)
+            msg_data = _coerce_msg(message, "broadcast")
+            self._store_message(msg_data)
             
-            print("[Peer] Broadcast from {}: {}".format(
-                msg_data["from"], msg_data["message"]))
-          
+            log.debug("[Peer] Broadcast from %s: %s",
+                      msg_data["from"], msg_data["message"])
+    
+    
     def connect_peer(self, peer_username, peer_ip, peer_port):
         """
         Establish P2P connection to another peer.
@@ -286,43 +719,43 @@ class PeerClient:
         :param peer_port (int): Port of target peer
         :return: bool - True if connection successful
         """
-        print("[Peer] Connecting to peer {} at {}:{}".format(
-            peer_username, peer_ip, peer_port))
+        # Reuse a live connection: opening another would leave the old one
+        # open and watched. The event loop unpublishes a connection once
+        # the peer hangs up, so a later call dials again.
+        pc = self.peer_connections.get(peer_username)
+        if pc is not None and pc.sock.fileno() >= 0:
+            log.debug("[Peer] Already connected to: %s", peer_username)
+            return True
+        
+        log.debug("[Peer] Connecting to peer %s at %s:%s", peer_username, peer_ip, peer_port)
         
+        sock = None
         try:
             # Create socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            _tune_socket(sock)
+            sock.settimeout(PEER_SEND_TIMEOUT)
             sock.connect((peer_ip, peer_port))
             
             # Send handshake
-            handshake = {
-                "type": "handshake",
-                "username": self.username
-            }
-            sock.sendall(json.dumps(handshake).encode('utf-8'))
+            sock.sendall(self._handshake_frame)
             
             # Receive response
-            response = sock.recv(4096).decode('utf-8')
-            response_data = json.loads(response)
+            tag, _ = _recv_frame(sock)
             
-            if response_data.get("type") == "handshake_ack":
+            if tag == TAG_HANDSHAKE_ACK:
                 # Store connection
                 with self.connections_lock:
-                    self.peer_connections[peer_username] = sock
+                    self._publish_peer(peer_username, PeerConn(sock, threading.Lock()))
                     self.peer_info[peer_username] = {
                         "ip": peer_ip,
                         "port": peer_port
                     }
                 
-                print("[Peer] Connected to peer: {}".format(peer_username))
+                log.info("[Peer] Connected to peer: %s", peer_username)
                 
-                # Start listening thread for this peer
-                listen_thread = threading.Thread(
-                    target=self._listen_to_peer,
-                    args=(sock, peer_username)
-                )
-                listen_thread.daemon = True
-                listen_thread.start()
+                # Messages from this peer are read by the event loop
+                self._watch_peer(sock, _PeerStream(peer_username))
                 
                 return True
             else:
@@ -330,7 +763,9 @@ class PeerClient:
                 return False
         
         except Exception as e:
-            print("[Peer] Failed to connect to {}: {}".format(peer_username, e))
+            log.warning("[Peer] Failed to connect to %s: %s", peer_username, e)
+            if sock is not None:
+                sock.close()
             return False
     
     
@@ -343,12 +778,11 @@ class PeerClient:
         :param channel (str): Channel name (optional)
         :return: bool - True if sent successfully
         """
-        with self.connections_lock:
-            if peer_username not in self.peer_connections:
-                print("[Peer] Not connected to peer: {}".format(peer_username))
-                return False
-            
-            conn = self.peer_connections[peer_username]
+        # peer_connections is an immutable snapshot; no lock needed
+        pc = self.peer_connections.get(peer_username)
+        if pc is None:
+            log.warning("[Peer] Not connected to peer: %s", peer_username)
+            return False
         
         try:
             msg_data = {
@@ -359,12 +793,15 @@ class PeerClient:
                 "time": datetime.now().isoformat()
             }
             
-            conn.sendall(json.dumps(msg_data).encode('utf-8'))
-            print("[Peer] Sent message to {}: {}".format(peer_username, message))
+            with pc.send_lock:
+                _send_frame(pc.sock, TAG_CHAT, msg_data)
+            log.debug("[Peer] Sent message to %s: %s", peer_username, message)
             return True
         
         except Exception as e:
-            print("[Peer] Failed to send to {}: {}".format(peer_username, e))
+            log.warning("[Peer] Failed to send to %s: %s", peer_username, e)
+            # A timed-out send may have left half a frame on the wire
+            self._abandon_peers([(peer_username, pc)])
             return False
     
     
@@ -376,31 +813,82 @@ class PeerClient:
         :param channel (str): Channel name
         :return: int - Number of peers message was sent to
         """
-        with self.connections_lock:
-            peer_list = list(self.peer_connections.items())
+        peer_list = self.peer_connections.items()
         
-        sent_count = 0
+        # Every peer gets the same bytes: encode them once
+        wire = _frame(TAG_BROADCAST, {
+            "type": "broadcast",
+            "from": self.username,
+            "channel": channel,
+            "message": message,
+            "time": datetime.now().isoformat()
+        })
         
-        for peer_username, conn in peer_list:
+        dead = []
+        
+        def send(item):
+            peer_username, pc = item
             try:
-                msg_data = {
-                    "type": "broadcast",
-                    "from": self.username,
-                    "channel": channel,
-                    "message": message,
-                    "time": datetime.now().isoformat()
-                }
-                
-                conn.sendall(json.dumps(msg_data).encode('utf-8'))
-                sent_count += 1
+                with pc.send_lock:
+                    pc.sock.sendall(wire)
+                return True
             
             except Exception as e:
-                print("[Peer] Failed to broadcast to {}: {}".format(peer_username, e))
+                log.warning("[Peer] Failed to broadcast to %s: %s", peer_username, e)
+                dead.append(item)
+                return False
+        
+        # Fan the sends out over the worker threads so one slow peer does
+        # not hold up the rest; a lone peer is sent to inline
+        if len(peer_list) > 1:
+            submit = self._workers.submit
+            futures = []
+            sent_count = 0
+            for item in peer_list:
+                try:
+                    futures.append(submit(send, item))
+                except RuntimeError:
+                    # stop() has shut the workers down
+                    sent_count += send(item)
+            sent_count += sum(f.result() for f in futures)
+        else:
+            sent_count = sum(map(send, peer_list))
+        
+        if dead:
+            self._abandon_peers(dead)
         
-        print("[Peer] Broadcasted to {} peers: {}".format(sent_count, message))
+        log.debug("[Peer] Broadcasted to %s peers: %s", sent_count, message)
         return sent_count
     
     
+    def _tracker_request(self, method, path, body):
+        """
+        Send one HTTP request to the tracker over the keep-alive connection
+        and read the reply. If a connection that was already open turns
+        out to have been closed by the tracker, the request is sent again
+        once, on a new connection.
+        
+        :param body (str): Request body
+        :return: (status, body) - HTTP status code and body bytes
+        """
+        conn = self._tracker_http
+        with self._tracker_lock:
+            while True:
+                reused = conn.sock is not None
+                try:
+                    conn.request(method, path, body=body.encode('utf-8'),
+                                 headers=self._tracker_headers)
+                    resp = conn.getresponse()
+                    return resp.status, resp.read()
+                except (BrokenPipeError, ConnectionResetError):
+                    conn.close()
+                    if not reused:
+                        raise
+                except Exception:
+                    conn.close()
+                    raise
+    
+    
     def register_with_tracker(self):
         """
         Register this peer with the tracker server.
@@ -416,30 +904,17 @@ class PeerClient:
                 "channels": self.channels
             })
             
-            request = (
-                "POST /submit-info HTTP/1.1\r\n"
-                "Host: {}:{}\r\n"
-                "Content-Type: text/plain\r\n"
-                "Content-Length: {}\r\n"
-                "\r\n"
-                "{}"
-            ).format(self.tracker_ip, self.tracker_port, len(body), body)
-            
             # Send to tracker
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((self.tracker_ip, self.tracker_port))
-            sock.sendall(request.encode('utf-8'))
-            
-            # Receive response
-            response = sock.recv(4096).decode('utf-8')
-            sock.close()
+            status, response = self._tracker_request("POST", "/submit-info", body)
             
-            print("[Peer] Registered with tracker")
-            print("[Peer] Response: {}".format(response[:200]))
+            log.info("[Peer] Registered with tracker")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[Peer] Response: %s %s",
+                          status, response[:200].decode('utf-8', 'replace'))
             return True
         
         except Exception as e:
-            print("[Peer] Failed to register with tracker: {}".format(e))
+            log.warning("[Peer] Failed to register with tracker: %s", e)
             return False
     
     
@@ -456,54 +931,30 @@ class PeerClient:
                 "channel": channel
             }) if channel else "{}"
             
-            request = (
-                "POST /get-list HTTP/1.1\r\n"
-                "Host: {}:{}\r\n"
-                "Content-Type: application/json\r\n"
-                "Content-Length: {}\r\n"
-                "\r\n"
-                "{}"
-            ).format(self.tracker_ip, self.tracker_port, len(body), body)
-            
-            # Send to tracker with timeout
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)  # 5 second timeout
+            # Send to tracker (TRACKER_TIMEOUT applies)
             try:
-                sock.connect((self.tracker_ip, self.tracker_port))
-                sock.sendall(request.encode('utf-8'))
-                
-                # Receive response
-                response = sock.recv(4096).decode('utf-8')
-                sock.close()
-                
-                # Parse response
-                if '\r\n\r\n' in response:
-                    body_part = response.split('\r\n\r\n', 1)[1]
-                    data = json.loads(body_part)
-                    
-                    if data.get("status") == "success":
-                        peers = data.get("peers", [])
-                        print("[Peer] Retrieved {} peers from tracker".format(len(peers)))
-                        return peers
-                    else:
-                        print("[Peer] Tracker returned error: {}".format(data.get("message", "Unknown")))
-                        return []
-                else:
-                    print("[Peer] Invalid response format from tracker")
-                    return []
+                status, response = self._tracker_request("POST", "/get-list", body)
             except socket.timeout:
-                print("[Peer] Timeout connecting to tracker")
-                sock.close()
+                log.warning("[Peer] Timeout connecting to tracker")
                 return []
             except socket.error as e:
-                print("[Peer] Socket error connecting to tracker: {}".format(e))
-                sock.close()
+                log.warning("[Peer] Socket error connecting to tracker: %s", e)
                 return []
             
-            return []
+            # Parse response
+            data = json.loads(response)
+            
+            if data.get("status") == "success":
+                peers = data.get("peers", [])
+                log.debug("[Peer] Retrieved %s peers from tracker", len(peers))
+                return peers
+            else:
+                log.warning("[Peer] Tracker returned error: %s",
+                            data.get("message", "Unknown"))
+                return []
         
         except Exception as e:
-            print("[Peer] Failed to get peer list: {}".format(e))
+            log.warning("[Peer] Failed to get peer list: %s", e)
             return []
     
     
@@ -521,68 +972,52 @@ class PeerClient:
                 "channel": channel
             })
             
-            request = (
-                "POST /add-list HTTP/1.1\r\n"
-                "Host: {}:{}\r\n"
-                "Content-Type: application/json\r\n"
-                "Content-Length: {}\r\n"
-                "\r\n"
-                "{}"
-            ).format(self.tracker_ip, self.tracker_port, len(body), body)
-            
             # Send to tracker
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((self.tracker_ip, self.tracker_port))
-            sock.sendall(request.encode('utf-8'))
-            
-            # Receive response
-            response = sock.recv(4096).decode('utf-8')
-            sock.close()
+            status, response = self._tracker_request("POST", "/add-list", body)
             
             # Parse response
-            if '\r\n\r\n' in response:
-                body_part = response.split('\r\n\r\n', 1)[1]
-                data = json.loads(body_part)
+            if response:
+                data = json.loads(response)
                 
                 if data.get("status") == "success":
                     if channel not in self.channels:
                         self.channels.append(channel)
-                    print("[Peer] Joined channel: {}".format(channel))
+                    log.info("[Peer] Joined channel: %s", channel)
                     
                     # Auto-connect to all peers in this channel
-                    print("[Peer] Auto-connecting to peers in channel '{}'...".format(channel))
+                    log.debug("[Peer] Auto-connecting to peers in channel '%s'...", channel)
                     peers = self.get_peer_list(channel)
                     
-                    connected_count = 0
+                    # One snapshot of the open connections, then connect to
+                    # the rest concurrently; each handshake is independent
+                    connected = self.peer_connections
+                    targets = []
                     for peer in peers:
                         peer_username = peer.get("username")
-                        peer_ip = peer.get("ip")
-                        peer_port = peer.get("port")
                         
                         # Don't connect to yourself
                         if peer_username == self.username:
                             continue
                         
                         # Skip if already connected
-                        with self.connections_lock:
-                            if peer_username in self.peer_connections:
-                                print("[Peer] Already connected to: {}".format(peer_username))
-                                continue
+                        if peer_username in connected:
+                            log.debug("[Peer] Already connected to: %s", peer_username)
+                            continue
                         
-                        # Try to connect
-                        if self.connect_peer(peer_username, peer_ip, peer_port):
-                            connected_count += 1
-                            time.sleep(0.1)  # Small delay between connections
+                        targets.append((peer_username, peer.get("ip"), peer.get("port")))
+                    
+                    connected_count = sum(self._workers.map(
+                        lambda target: self.connect_peer(*target), targets))
                     
-                    print("[Peer] Auto-connected to {} peers in channel '{}'".format(
-                        connected_count, channel))
+                    log.info("[Peer] Auto-connected to %s peers in channel '%s'",
+                             connected_count, channel)
                     
                     return True
             
             return False
         
         except Exception as e:
-            print("[Peer] Failed to join channel: {}".format(e))
+            log.warning("[Peer] Failed to join channel: %s", e)
             return False
     
     
@@ -595,9 +1030,9 @@ class PeerClient:
         """
         with self.messages_lock:
             if channel:
-                return [m for m in self.messages if m["channel"] == channel]
+                return list(self.messages_by_channel.get(channel, ()))
             else:
-                return self.messages[:]
+                return list(self.messages)
 
 
 def main():
@@ -612,8 +1047,11 @@ def main():
     parser.add_argument('--peer-port', type=int, required=True, help='Your port for P2P')
     parser.add_argument('--tracker-ip', default='127.0.0.1', help='Tracker server IP')
     parser.add_argument('--tracker-port', type=int, default=8001, help='Tracker server port')
+    parser.add_argument('--log-level', default='DEBUG',
+                        help='Peer log level (DEBUG shows every message sent and received)')
     
     args = parser.parse_args()
+    log_listener = configure_logging(args.log_level)
     
     # Create peer client
     peer = PeerClient(
@@ -703,6 +1141,7 @@ def main():
     
     finally:
         peer.stop()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
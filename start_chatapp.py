@@ -27,105 +27,318 @@ The tracker server manages:
 - Peer discovery
 """
 
-import json
+import logging
+import os
+import re
+import secrets
 import socket
-import argparse
 import threading
+import time
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from types import MappingProxyType
+from urllib.parse import urlparse, parse_qsl
 from daemon.weaprous import WeApRous
+from daemon.resp_template import RESP_TEMPLATES
+from daemon.utils import MAX_FORM_BODY, json_dumps_bytes, json_loads
 
 PORT = 8001  # Default port for chat tracker server
 
+log = logging.getLogger("chatapp")
+
 # Global data structures for tracking
 peers_list = []  # List of active peers: [{"username": str, "ip": str, "port": int, "channels": []}]
-channels_list = {}  # Dictionary of channels: {channel_name: [usernames]}
+peers_index = {}  # {username: index into peers_list}, guarded by peers_lock
+# Copy-on-write: writers build a new dict (and new member sets) under
+# channels_lock and rebind the name; readers use the current one unlocked
+channels_list = {}  # Dictionary of channels: {channel_name: frozenset(usernames)}
+# Copy-on-write like channels_list: register() publishes a new dict under
+# _users_lock, readers use the current one unlocked
 users_credentials = {"admin": "password"}  # Simple user database
+_users_lock = threading.Lock()  # Serializes writers of users_credentials
 peers_lock = threading.Lock()  # Thread-safe access to peers_list
-channels_lock = threading.Lock()  # Thread-safe access to channels_list
+
+# Peer dicts are replaced, never mutated, once they are in peers_list, so
+# a shallow copy of the list is a consistent snapshot. It is only retaken
+# after a write has bumped _peers_version.
+_PeersSnapshot = namedtuple("_PeersSnapshot", ["peers", "by_username", "version"])
+_peers_version = 0
+_peers_snapshot = _PeersSnapshot((), {}, 0)
+_NO_PEER = MappingProxyType({})  # by_username default: a peer in no channels
+# Peer fields /send-peer hands out; the stored dicts also carry channels
+_TARGET_PEER_FIELDS = ("username", "ip", "port")
+channels_lock = threading.Lock()  # Serializes writers of channels_list
+_channels_version = 0  # Bumped after each new channels_list is published
+
+# Serialized /get-list responses keyed by
+# (peers version, channels version, channel filter, username filter)
+_get_list_cache = OrderedDict()
+_get_list_cache_lock = threading.Lock()
+GET_LIST_CACHE_SIZE = 64
+
+_INDEX_HTML = None  # www/index.html bytes once read (see _load_index_html)
+
+#: Seconds a login token stays valid
+SESSION_TTL = 3600
+# {token: (username, expiry)}. Every session gets the same TTL, so
+# insertion order is expiry order and expired entries sit at the front.
+_sessions = OrderedDict()
+_sessions_lock = threading.Lock()  # Serializes writers of _sessions
+
+# Constant error responses, serialized once
+_ERR_INVALID_LOGIN = json_dumps_bytes({"status": "failed", "message": "Invalid username or password"})
+_ERR_MISSING_FIELDS = json_dumps_bytes({"status": "failed", "message": "Missing required fields"})
+_ERR_MISSING_USER_CHANNEL = json_dumps_bytes({"status": "failed", "message": "Missing username or channel"})
+_ERR_MISSING_CREDENTIALS = json_dumps_bytes({"status": "failed", "message": "Missing username or password"})
+_ERR_USER_EXISTS = json_dumps_bytes({"status": "failed", "message": "Username already exists"})
+_ERR_MISSING_BODY = json_dumps_bytes({"status": "error", "message": "Missing request body"})
+_ERR_USERNAME_REQUIRED = json_dumps_bytes({"status": "error", "message": "Username required"})
+_ERR_USERNAME_CHANNEL_REQUIRED = json_dumps_bytes({"status": "error", "message": "Username and channel required"})
+_ERR_FROM_TO_REQUIRED = json_dumps_bytes({"status": "error", "message": "From and to usernames required"})
+_ERR_INVALID_JSON = json_dumps_bytes({"status": "error", "message": "Invalid JSON"})
+_ERR_INVALID_TOKEN = json_dumps_bytes({"status": "failed", "message": "Invalid or expired token"})
+_ERR_BODY_TOO_LARGE = json_dumps_bytes({"status": "error", "message": "Request body too large"})
+
+#: Longest /login or /register body worth parsing; the other handlers are
+#: capped at daemon.utils.MAX_FORM_BODY
+_MAX_LOGIN_BODY = 4096
+
+def _json_object(body):
+    """
+    Parse a JSON object request body. Returns None, without going through
+    the parser, when the body cannot be one (e.g. a form-encoded login).
+    """
+    if not body.lstrip().startswith("{"):
+        return None
+    try:
+        data = json_loads(body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _template_response(name, extra_headers=True):
+    """Build a constant (status, headers, body) triple from RESP_TEMPLATES."""
+    e = RESP_TEMPLATES[name]
+    headers = {"Content-Type": e["content_type"]}
+    if extra_headers:
+        headers.update(e["headers"])
+    # The adapter copies hook headers before adding its own
+    return (e["status"], MappingProxyType(headers), e["body"])
+
+
+_LOGIN_FAILED = _template_response("login_failed")
+_SERVER_ERROR = _template_response("server_error", extra_headers=False)
 
 app = WeApRous()
 
+
+def _preflight_headers(methods, **extra):
+    """CORS preflight response headers, complete so the adapter sends them as-is."""
+    return {
+        "Content-Type": "text/plain; charset=utf-8",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": methods,
+        "Access-Control-Allow-Headers": "Content-Type",
+        # Browsers may reuse a preflight for this long (capped by the browser)
+        "Access-Control-Max-Age": "86400",
+        **extra,
+    }
+
+
+# OPTIONS responses are the same for every request; /login only swaps in
+# the caller's origin, which credentialed requests require
+_PREFLIGHT_OK = ("200 OK", MappingProxyType(_preflight_headers("GET, POST, OPTIONS")), b"")
+_PREFLIGHT_POST_OK = ("200 OK", MappingProxyType(_preflight_headers("POST, OPTIONS")), b"")
+_LOGIN_PREFLIGHT_HEADERS = MappingProxyType(
+    _preflight_headers("POST, OPTIONS", **{"Access-Control-Allow-Credentials": "true"}))
+
+
+def _verify(username, password):
+    """Check a username/password pair against users_credentials."""
+    if not isinstance(username, str) or not isinstance(password, str):
+        return False
+    return users_credentials.get(username) == password
+
+
+def _new_session(username):
+    """Issue an opaque login token for ``username``, dropping expired ones."""
+    token = secrets.token_urlsafe(24)
+    now = time.monotonic()
+    with _sessions_lock:
+        while _sessions and next(iter(_sessions.values()))[1] <= now:
+            _sessions.popitem(last=False)
+        _sessions[token] = (username, now + SESSION_TTL)
+    return token
+
+
+def _validate_token(token):
+    """Return the username a login token was issued to, or None."""
+    session = _sessions.get(token)
+    if session is None or session[1] <= time.monotonic():
+        return None
+    return session[0]
+
+
+def _session_user(headers, username):
+    """
+    Return the caller's username: the owner of an ``Authorization: Bearer``
+    token when one is sent, else ``username`` from the body. None when the
+    token is unknown or expired.
+    """
+    auth = headers.get('authorization') if isinstance(headers, Mapping) else None
+    if not auth:
+        return username
+    scheme, _, token = auth.partition(' ')
+    if scheme.lower() != 'bearer':
+        return username
+    return _validate_token(token.strip())
+
+# First Origin line of a raw header block
+_ORIGIN_RE = re.compile(r'(?im)^origin:[ \t]*(.+?)[ \t]*\r?$')
+
+
+def _extract_origin(headers):
+    """
+    Return the request's origin: the Origin header, else scheme://host of
+    the Referer. ``headers`` is the adapter's CaseInsensitiveDict (any
+    Mapping) or a raw header string. None when neither is present.
+    """
+    if isinstance(headers, Mapping):
+        origin = headers.get('origin')
+        if origin:
+            return origin
+        referer = headers.get('referer')
+        if referer:
+            parsed = urlparse(referer)
+            return f"{parsed.scheme}://{parsed.netloc}"
+        return None
+    if isinstance(headers, str):
+        m = _ORIGIN_RE.search(headers)
+        return m.group(1) if m else None
+    return None
+
+
+def _peers_changed():
+    """Record a change to peers_list. Call with peers_lock held."""
+    global _peers_version
+    _peers_version += 1
+    with _get_list_cache_lock:
+        _get_list_cache.clear()
+
+
+def _channels_changed():
+    """Record a newly published channels_list. Call with channels_lock held."""
+    global _channels_version
+    _channels_version += 1
+    with _get_list_cache_lock:
+        _get_list_cache.clear()
+
+
+def _current_peers():
+    """
+    Return a _PeersSnapshot of peers_list, retaken only after changes:
+    the peer dicts in order, the same dicts keyed by username, and the
+    _peers_version they match.
+    """
+    global _peers_snapshot
+    snapshot = _peers_snapshot
+    if snapshot.version != _peers_version:
+        with peers_lock:
+            # Readers that queued behind a rebuild reuse its result
+            snapshot = _peers_snapshot
+            if snapshot.version != _peers_version:
+                peers = tuple(peers_list)
+                snapshot = _peers_snapshot = _PeersSnapshot(
+                    peers, {p["username"]: p for p in peers}, _peers_version)
+    return snapshot
+
+
+def _channel_members(channels):
+    """``channels`` with each member set as a sorted list, for responses."""
+    return {name: sorted(members) for name, members in channels.items()}
+
+def _cache_get_list(key, encoded):
+    """Remember a serialized /get-list response, dropping the oldest past the cap."""
+    with _get_list_cache_lock:
+        _get_list_cache[key] = encoded
+        while len(_get_list_cache) > GET_LIST_CACHE_SIZE:
+            _get_list_cache.popitem(last=False)
+
+
+def _join_channels(username, channels):
+    """
+    Add ``username`` to each of ``channels``, publishing a new channels_list.
+    Returns True if any membership changed.
+    """
+    global channels_list
+    with channels_lock:
+        new_channels = None
+        for channel in channels:
+            members = (new_channels or channels_list).get(channel, frozenset())
+            if username not in members:
+                if new_channels is None:
+                    new_channels = dict(channels_list)
+                new_channels[channel] = members | {username}
+        if new_channels is None:
+            return False
+        channels_list = new_channels
+        _channels_changed()
+        return True
+
+
+def _load_index_html():
+    """
+    Return www/index.html for the form login page, read from disk once and
+    kept in memory afterwards. None (retried on the next call) if the file
+    cannot be read.
+    """
+    global _INDEX_HTML
+    if _INDEX_HTML is None:
+        try:
+            with open(os.path.join("www", "index.html"), "rb") as f:
+                _INDEX_HTML = f.read()
+        except OSError as e:
+            log.warning("[ChatApp] Cannot read index.html: %s", e)
+    return _INDEX_HTML
+
 @app.route('/login', methods=['OPTIONS'])
 def login_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS with credentials."""
-    # Get origin from headers
-    origin = None
-    if isinstance(headers, dict):
-        origin = headers.get('origin')
-        
-        # Fallback: try Referer header if Origin is not present
-        if not origin:
-            referer = headers.get('referer') or headers.get('Referer')
-            if referer:
-                try:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(referer)
-                    origin = f"{parsed.scheme}://{parsed.netloc}"
-                    print("[ChatApp] OPTIONS - Extracted origin from Referer: {} -> {}".format(referer, origin))
-                except:
-                    pass
-    elif isinstance(headers, str) and 'origin:' in headers.lower():
-        for line in headers.split('\n'):
-            if 'origin:' in line.lower():
-                origin = line.split(':', 1)[1].strip()
-                break
+    origin = _extract_origin(headers)
     
     # Use origin from request if available (required for credentials)
     # MUST return exact origin from request for CORS with credentials
     if origin:
         cors_origin = origin
-        print("[ChatApp] OPTIONS - Using origin from request: {}".format(origin))
+        log.debug("[ChatApp] OPTIONS - Using origin from request: %s", origin)
     else:
         # Fallback (should rarely happen)
         cors_origin = "http://localhost:8001"
-        print("[ChatApp] OPTIONS - Warning: No origin, using default: {}".format(cors_origin))
+        log.debug("[ChatApp] OPTIONS - Warning: No origin, using default: %s", cors_origin)
     
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": cors_origin,  # Specific origin for credentials
-        "Access-Control-Allow-Credentials": "true",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    # Specific origin for credentials
+    return ("200 OK", {**_LOGIN_PREFLIGHT_HEADERS, "Access-Control-Allow-Origin": cors_origin}, b"")
 
 @app.route('/submit-info', methods=['OPTIONS'])
 def submit_info_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/add-list', methods=['OPTIONS'])
 def add_list_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/get-list', methods=['OPTIONS'])
 def get_list_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/register', methods=['OPTIONS'])
 def register_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/login', methods=['POST'])
 def login(headers="guest", body="anonymous"):
@@ -140,58 +353,15 @@ def login(headers="guest", body="anonymous"):
     :param body (str): The request body containing login credentials.
     :return: HTML response with Set-Cookie (Task 1) OR JSON response (Task 2)
     """
-    print("[ChatApp] Login request received")
+    log.debug("[ChatApp] Login request received")
     
     # Get origin from headers for CORS with credentials
-    origin = None
-    if isinstance(headers, dict):
-        # Headers dict from httpadapter (CaseInsensitiveDict)
-        # CaseInsensitiveDict stores keys in lowercase, so 'origin' should work
-        origin = headers.get('origin')
-        
-        # Fallback: try Referer header if Origin is not present
-        # Referer format: http://localhost:8002/chat.html -> extract http://localhost:8002
-        if not origin:
-            referer = headers.get('referer') or headers.get('Referer')
-            if referer:
-                try:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(referer)
-                    origin = f"{parsed.scheme}://{parsed.netloc}"
-                    print("[ChatApp] ✓ Extracted origin from Referer: {} -> {}".format(referer, origin))
-                except:
-                    pass
-        
-        # Debug: print all headers to see what we have
-        if not origin:
-            print("[ChatApp] ⚠️ Origin not found in headers!")
-            print("[ChatApp] Debug - Available headers keys: {}".format(list(headers.keys())[:20]))
-            print("[ChatApp] Debug - Full headers dict (first 10): {}".format(dict(list(headers.items())[:10])))
-            # Try to find origin in any case variation (shouldn't be needed with CaseInsensitiveDict)
-            for key, value in headers.items():
-                if key.lower() == 'origin':
-                    origin = value
-                    print("[ChatApp] ✓ Found origin via iteration: {} = {}".format(key, value))
-                    break
-        else:
-            print("[ChatApp] ✓ Found origin in headers: origin = {}".format(origin))
-    elif isinstance(headers, str):
-        # String format - parse it
-        print("[ChatApp] Debug - Headers is string, parsing...")
-        if 'origin:' in headers.lower():
-            for line in headers.split('\n'):
-                if 'origin:' in line.lower():
-                    origin = line.split(':', 1)[1].strip()
-                    print("[ChatApp] ✓ Found origin in string headers: {}".format(origin))
-                    break
-    
-    print("[ChatApp] Final origin from request: {} (type: {})".format(origin, type(headers)))
-    
-    # CRITICAL DEBUG: If origin is None, print ALL headers to debug
-    if not origin and isinstance(headers, dict):
-        print("[ChatApp] 🔴 CRITICAL DEBUG - Origin is None! Printing ALL headers:")
-        for key, value in headers.items():
-            print("[ChatApp]   Header: '{}' = '{}'".format(key, value))
+    origin = _extract_origin(headers)
+    log.debug("[ChatApp] Final origin from request: %s", origin)
+    
+    # Nothing to check, or too much to be a login: fail before parsing
+    if not body or body == "anonymous" or len(body) > _MAX_LOGIN_BODY:
+        return _LOGIN_FAILED
     
     try:
         # Try to parse as JSON first (Task 2)
@@ -203,93 +373,49 @@ def login(headers="guest", body="anonymous"):
             if isinstance(body, bytes):
                 body = body.decode("utf-8", "ignore")
             
-            try:
-                data = json.loads(body)
+            data = _json_object(body)
+            if data is not None:
                 is_json = True
-            except:
+            else:
                 # If not JSON, parse as form data (Task 1)
-                data = {}
-                for pair in body.split("&"):
-                    if "=" in pair:
-                        k, v = pair.split("=", 1)
-                        # URL decode values
-                        from urllib.parse import unquote
-                        data[unquote(k)] = unquote(v)
+                data = dict(parse_qsl(body, keep_blank_values=True))
                 is_json = False
         
         username = data.get("username", "")
         password = data.get("password", "")
         
-        print("[ChatApp] Login attempt: username={}, format={}".format(
-            username, "JSON" if is_json else "FORM"))
+        log.debug("[ChatApp] Login attempt: username=%s, format=%s", username, "JSON" if is_json else "FORM")
         
         # Validate credentials
-        if username in users_credentials and users_credentials[username] == password:
+        if _verify(username, password):
             if is_json:
                 # Task 2: JSON response for RESTful API
                 response = {
                     "status": "success",
                     "message": "Login successful",
                     "username": username,
-                    "token": "token_{}".format(username)
+                    "token": _new_session(username)
                 }
-                print("[ChatApp] Login successful (JSON) for user: {}".format(username))
-                return json.dumps(response)
+                log.debug("[ChatApp] Login successful (JSON) for user: %s", username)
+                return json_dumps_bytes(response)
             else:
                 # Task 1: HTML response with Set-Cookie header
                 # This will be handled by returning a tuple (status, headers, body)
-                import os
-                
-                # Read index.html directly
-                index_path = os.path.join("www", "index.html")
-                if os.path.exists(index_path):
-                    with open(index_path, "rb") as f:
-                        body_content = f.read()
-                else:
+                body_content = _load_index_html()
+                if body_content is None:
                     # Fallback: simple HTML
                     body_content = b"<html><body><h1>Login Successful</h1><p>Welcome, " + username.encode("utf-8") + b"</p></body></html>"
                 
-                # Use origin from request if available
                 # For credentials, we MUST return the exact origin from request
-                # If Origin header is missing, try to get from Referer header
-                if not origin and isinstance(headers, dict):
-                    referer = headers.get('referer') or headers.get('Referer')
-                    if referer:
-                        try:
-                            from urllib.parse import urlparse
-                            parsed = urlparse(referer)
-                            origin = f"{parsed.scheme}://{parsed.netloc}"
-                            print("[ChatApp] ✓ Extracted origin from Referer: {} -> {}".format(referer, origin))
-                        except Exception as e:
-                            print("[ChatApp] ⚠️ Failed to parse Referer: {}".format(e))
-                
                 if origin:
                     cors_origin = origin
-                    print("[ChatApp] Using origin: {}".format(origin))
+                    log.debug("[ChatApp] Using origin: %s", origin)
                 else:
-                    # This should NOT happen - browser always sends Origin or Referer header
-                    # For development, try to detect from Referer or use common port
-                    print("[ChatApp] ⚠️ CRITICAL: No origin found! Trying to detect from Referer...")
-                    if isinstance(headers, dict):
-                        referer = headers.get('referer') or headers.get('Referer')
-                        if referer:
-                            # Try to extract origin from Referer
-                            if '8080' in referer:
-                                cors_origin = "http://localhost:8080"
-                            elif '8002' in referer:
-                                cors_origin = "http://localhost:8002"
-                            elif '8001' in referer:
-                                cors_origin = "http://localhost:8001"
-                            else:
-                                # Default to 8080 (most common for proxy)
-                                cors_origin = "http://localhost:8080"
-                        else:
-                            # No referer either - default to 8080 (proxy port)
-                            cors_origin = "http://localhost:8080"
-                    else:
-                        # Default to 8080 (proxy port)
-                        cors_origin = "http://localhost:8080"
-                    print("[ChatApp] ⚠️ Using fallback origin: {} (development only)".format(cors_origin))
+                    # This should NOT happen - browser always sends Origin or Referer header.
+                    # A Referer would already have given an origin (see
+                    # _extract_origin), so assume the proxy port
+                    cors_origin = "http://localhost:8080"
+                    log.debug("[ChatApp] Using fallback origin: %s (development only)", cors_origin)
                 
                 headers = {
                     "Content-Type": "text/html; charset=utf-8",
@@ -300,33 +426,26 @@ def login(headers="guest", body="anonymous"):
                     "Access-Control-Allow-Headers": "Content-Type"
                 }
                 
-                print("[ChatApp] CORS Origin set to: {} (for credentials)".format(cors_origin))
+                log.debug("[ChatApp] CORS Origin set to: %s (for credentials)", cors_origin)
                 
-                print("[ChatApp] Login successful (FORM) for user: {}, Set-Cookie: auth=true, Origin: {}".format(username, origin))
+                log.debug("[ChatApp] Login successful (FORM) for user: %s, Origin: %s",
+                          username, origin)
                 return ("200 OK", headers, body_content)
         else:
             # Wrong credentials
             if is_json:
                 # Task 2: JSON error response
-                response = {
-                    "status": "failed",
-                    "message": "Invalid username or password"
-                }
-                return json.dumps(response)
+                return _ERR_INVALID_LOGIN
             else:
                 # Task 1: HTML error response (401)
-                from daemon.resp_template import RESP_TEMPLATES
-                e = RESP_TEMPLATES["login_failed"]
-                return (e["status"], {"Content-Type": e["content_type"], **e["headers"]}, e["body"])
+                return _LOGIN_FAILED
     
     except Exception as e:
-        print("[ChatApp] Error in login: {}".format(e))
+        log.warning("[ChatApp] Error in login: %s", e)
         if is_json:
-            return json.dumps({"status": "error", "message": str(e)})
+            return json_dumps_bytes({"status": "error", "message": str(e)})
         else:
-            from daemon.resp_template import RESP_TEMPLATES
-            e_tmpl = RESP_TEMPLATES["server_error"]
-            return (e_tmpl["status"], {"Content-Type": e_tmpl["content_type"]}, e_tmpl["body"])
+            return _SERVER_ERROR
 
 
 @app.route('/submit-info', methods=['POST'])
@@ -341,29 +460,31 @@ def submit_info(headers="guest", body="anonymous"):
     :param body (str): The request body containing peer information
     :return: JSON response with registration status
     """
-    print("[ChatApp] Peer registration request received")
+    log.debug("[ChatApp] Peer registration request received")
     
     try:
         # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
+        if body and len(body) > MAX_FORM_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body) if body and body != "anonymous" else {}
+        if data is None:
+            return _ERR_INVALID_JSON
+        username = _session_user(headers, data.get("username", ""))
+        if username is None:
+            return _ERR_INVALID_TOKEN
         ip = data.get("ip", "")
         port = data.get("port", 0)
         channels = data.get("channels", [])
         
-        print("[ChatApp] Registering peer: username={}, ip={}, port={}".format(username, ip, port))
+        log.debug("[ChatApp] Registering peer: username=%s, ip=%s, port=%s", username, ip, port)
         
         if not username or not ip or not port:
-            return json.dumps({"status": "failed", "message": "Missing required fields"})
+            return _ERR_MISSING_FIELDS
         
         # Thread-safe peer registration
         with peers_lock:
             # Check if peer already exists (update if exists)
-            existing_peer = None
-            for i, peer in enumerate(peers_list):
-                if peer["username"] == username:
-                    existing_peer = i
-                    break
+            existing_peer = peers_index.get(username)
             
             peer_info = {
                 "username": username,
@@ -372,22 +493,19 @@ def submit_info(headers="guest", body="anonymous"):
                 "channels": channels
             }
             
+            _peers_changed()
             if existing_peer is not None:
                 peers_list[existing_peer] = peer_info
                 peer_id = existing_peer
-                print("[ChatApp] Updated existing peer: {}".format(username))
+                log.debug("[ChatApp] Updated existing peer: %s", username)
             else:
                 peers_list.append(peer_info)
                 peer_id = len(peers_list) - 1
-                print("[ChatApp] Added new peer: {}".format(username))
+                peers_index[username] = peer_id
+                log.debug("[ChatApp] Added new peer: %s", username)
         
         # Update channels
-        with channels_lock:
-            for channel in channels:
-                if channel not in channels_list:
-                    channels_list[channel] = []
-                if username not in channels_list[channel]:
-                    channels_list[channel].append(username)
+        _join_channels(username, channels)
         
         response = {
             "status": "success",
@@ -396,12 +514,12 @@ def submit_info(headers="guest", body="anonymous"):
             "total_peers": len(peers_list)
         }
         
-        print("[ChatApp] Peer registered: {} (total peers: {})".format(username, len(peers_list)))
-        return json.dumps(response)
+        log.debug("[ChatApp] Peer registered: %s (total peers: %s)", username, len(peers_list))
+        return json_dumps_bytes(response)
     
     except Exception as e:
-        print("[ChatApp] Error in submit-info: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in submit-info: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/add-list', methods=['POST'])
@@ -416,39 +534,40 @@ def add_list(headers="guest", body="anonymous"):
     :param body (str): The request body containing channel information
     :return: JSON response with channel status
     """
-    print("[ChatApp] Add to channel request received")
+    log.debug("[ChatApp] Add to channel request received")
     
     try:
         # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
+        if body and len(body) > MAX_FORM_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body) if body and body != "anonymous" else {}
+        if data is None:
+            return _ERR_INVALID_JSON
+        username = _session_user(headers, data.get("username", ""))
+        if username is None:
+            return _ERR_INVALID_TOKEN
         channel = data.get("channel", "")
         
-        print("[ChatApp] Adding user {} to channel {}".format(username, channel))
+        log.debug("[ChatApp] Adding user %s to channel %s", username, channel)
         
         if not username or not channel:
-            return json.dumps({"status": "failed", "message": "Missing username or channel"})
+            return _ERR_MISSING_USER_CHANNEL
         
         # Thread-safe channel update
-        with channels_lock:
-            if channel not in channels_list:
-                channels_list[channel] = []
-            
-            if username not in channels_list[channel]:
-                channels_list[channel].append(username)
-                message = "User added to channel successfully"
-            else:
-                message = "User already in channel"
-            
-            members = channels_list[channel][:]
+        if _join_channels(username, (channel,)):
+            message = "User added to channel successfully"
+        else:
+            message = "User already in channel"
+        members = sorted(channels_list.get(channel, ()))
         
         # Update peer's channel list
         with peers_lock:
-            for peer in peers_list:
-                if peer["username"] == username:
-                    if channel not in peer["channels"]:
-                        peer["channels"].append(channel)
-                    break
+            idx = peers_index.get(username)
+            if idx is not None:
+                peer = peers_list[idx]
+                if channel not in peer["channels"]:
+                    peers_list[idx] = {**peer, "channels": peer["channels"] + [channel]}
+                    _peers_changed()
         
         response = {
             "status": "success",
@@ -458,23 +577,18 @@ def add_list(headers="guest", body="anonymous"):
             "member_count": len(members)
         }
         
-        print("[ChatApp] Channel {} now has {} members".format(channel, len(members)))
-        return json.dumps(response)
+        log.debug("[ChatApp] Channel %s now has %s members", channel, len(members))
+        return json_dumps_bytes(response)
     
     except Exception as e:
-        print("[ChatApp] Error in add-list: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in add-list: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/remove-list', methods=['OPTIONS'])
 def remove_list_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/remove-list', methods=['POST'])
 def remove_list(headers="guest", body="anonymous"):
@@ -488,30 +602,43 @@ def remove_list(headers="guest", body="anonymous"):
     :param body (str): The request body containing channel information
     :return: JSON response with channel status
     """
-    print("[ChatApp] Remove from channel request received")
+    global channels_list
+    log.debug("[ChatApp] Remove from channel request received")
     
     try:
         # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
+        if body and len(body) > MAX_FORM_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body) if body and body != "anonymous" else {}
+        if data is None:
+            return _ERR_INVALID_JSON
+        username = _session_user(headers, data.get("username", ""))
+        if username is None:
+            return _ERR_INVALID_TOKEN
         channel = data.get("channel", "")
         
-        print("[ChatApp] Removing user {} from channel {}".format(username, channel))
+        log.debug("[ChatApp] Removing user %s from channel %s", username, channel)
         
         if not username or not channel:
-            return json.dumps({"status": "failed", "message": "Missing username or channel"})
+            return _ERR_MISSING_USER_CHANNEL
         
         # Thread-safe channel update
         with channels_lock:
-            if channel in channels_list:
-                if username in channels_list[channel]:
-                    channels_list[channel].remove(username)
+            members = channels_list.get(channel)
+            if members is not None:
+                if username in members:
+                    new_channels = dict(channels_list)
+                    remaining = members - {username}
                     message = "User removed from channel successfully"
                     
                     # Remove channel if empty
-                    if len(channels_list[channel]) == 0:
-                        del channels_list[channel]
-                        print("[ChatApp] Channel '{}' deleted (no members)".format(channel))
+                    if remaining:
+                        new_channels[channel] = remaining
+                    else:
+                        del new_channels[channel]
+                        log.debug("[ChatApp] Channel '%s' deleted (no members)", channel)
+                    channels_list = new_channels
+                    _channels_changed()
                 else:
                     message = "User not in channel"
             else:
@@ -519,11 +646,15 @@ def remove_list(headers="guest", body="anonymous"):
         
         # Update peer's channel list
         with peers_lock:
-            for peer in peers_list:
-                if peer["username"] == username:
-                    if channel in peer["channels"]:
-                        peer["channels"].remove(channel)
-                    break
+            idx = peers_index.get(username)
+            if idx is not None:
+                peer = peers_list[idx]
+                if channel in peer["channels"]:
+                    peers_list[idx] = {
+                        **peer,
+                        "channels": [c for c in peer["channels"] if c != channel]
+                    }
+                    _peers_changed()
         
         response = {
             "status": "success",
@@ -531,12 +662,12 @@ def remove_list(headers="guest", body="anonymous"):
             "channel": channel
         }
         
-        print("[ChatApp] User {} removed from channel '{}'".format(username, channel))
-        return json.dumps(response)
+        log.debug("[ChatApp] User %s removed from channel '%s'", username, channel)
+        return json_dumps_bytes(response)
     
     except Exception as e:
-        print("[ChatApp] Error in remove-list: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in remove-list: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/get-list', methods=['GET', 'POST'])
@@ -551,26 +682,36 @@ def get_list(headers="guest", body="anonymous"):
     :param body (str): Optional filter parameters
     :return: JSON response with peer/channel list
     """
-    print("[ChatApp] Get list request received")
+    log.debug("[ChatApp] Get list request received")
     
     try:
         # Parse JSON body if provided
         data = {}
         if body and body != "anonymous":
-            try:
-                data = json.loads(body)
-            except:
-                pass
+            if len(body) > MAX_FORM_BODY:
+                return _ERR_BODY_TOO_LARGE
+            # Filters are optional: ignore a body that is not a JSON object
+            data = _json_object(body) or {}
         
         channel_filter = data.get("channel", None)
         username_filter = data.get("username", None)
         
+        # Version before data: a racing write can only make the cached
+        # entry newer than its key, never older
+        channels_version = _channels_version
+        # Never mutated once published, so no copy is needed
+        channels_copy = channels_list
+        
         # Thread-safe read
-        with peers_lock:
-            peers_copy = [peer.copy() for peer in peers_list]
+        peers_copy, _, peers_version = _current_peers()
         
-        with channels_lock:
-            channels_copy = {k: v[:] for k, v in channels_list.items()}
+        key = None
+        if (isinstance(channel_filter, (str, type(None)))
+                and isinstance(username_filter, (str, type(None)))):
+            key = (peers_version, channels_version, channel_filter, username_filter)
+            cached = _get_list_cache.get(key)
+            if cached is not None:
+                return cached
         
         # Apply filters
         if channel_filter and channel_filter in channels_copy:
@@ -586,7 +727,7 @@ def get_list(headers="guest", body="anonymous"):
         elif username_filter:
             # Get specific user's info
             user_peer = [p for p in peers_copy if p["username"] == username_filter]
-            user_channels = channels_copy
+            user_channels = _channel_members(channels_copy)
             response = {
                 "status": "success",
                 "peers": user_peer,
@@ -597,18 +738,21 @@ def get_list(headers="guest", body="anonymous"):
             response = {
                 "status": "success",
                 "peers": peers_copy,
-                "channels": channels_copy,
+                "channels": _channel_members(channels_copy),
                 "total_peers": len(peers_copy),
                 "total_channels": len(channels_copy)
             }
         
-        print("[ChatApp] Returned list: {} peers, {} channels".format(
-            len(peers_copy), len(channels_copy)))
-        return json.dumps(response)
+        log.debug("[ChatApp] Returned list: %s peers, %s channels",
+                  len(peers_copy), len(channels_copy))
+        encoded = json_dumps_bytes(response)
+        if key is not None:
+            _cache_get_list(key, encoded)
+        return encoded
     
     except Exception as e:
-        print("[ChatApp] Error in get-list: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in get-list: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/register', methods=['POST'])
@@ -623,24 +767,29 @@ def register(headers="guest", body="anonymous"):
     :param body (str): The request body containing registration info
     :return: JSON response with registration status
     """
-    print("[ChatApp] User registration request received")
+    global users_credentials
+    log.debug("[ChatApp] User registration request received")
     
     try:
         # Parse JSON body
-        data = json.loads(body) if body and body != "anonymous" else {}
+        if body and len(body) > _MAX_LOGIN_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body) if body and body != "anonymous" else {}
+        if data is None:
+            return _ERR_INVALID_JSON
         username = data.get("username", "")
         password = data.get("password", "")
         
-        print("[ChatApp] Registration attempt: username={}".format(username))
+        log.debug("[ChatApp] Registration attempt: username=%s", username)
         
         if not username or not password:
-            return json.dumps({"status": "failed", "message": "Missing username or password"})
-        
-        if username in users_credentials:
-            return json.dumps({"status": "failed", "message": "Username already exists"})
+            return _ERR_MISSING_CREDENTIALS
         
         # Register new user
-        users_credentials[username] = password
+        with _users_lock:
+            if username in users_credentials:
+                return _ERR_USER_EXISTS
+            users_credentials = {**users_credentials, username: password}
         
         response = {
             "status": "success",
@@ -648,12 +797,12 @@ def register(headers="guest", body="anonymous"):
             "username": username
         }
         
-        print("[ChatApp] User registered: {}".format(username))
-        return json.dumps(response)
+        log.debug("[ChatApp] User registered: %s", username)
+        return json_dumps_bytes(response)
     
     except Exception as e:
-        print("[ChatApp] Error in register: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in register: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/status', methods=['GET'])
@@ -670,8 +819,7 @@ def status(headers="guest", body="anonymous"):
     with peers_lock:
         peer_count = len(peers_list)
     
-    with channels_lock:
-        channel_count = len(channels_list)
+    channel_count = len(channels_list)
     
     response = {
         "status": "online",
@@ -682,18 +830,13 @@ def status(headers="guest", body="anonymous"):
         }
     }
     
-    return json.dumps(response)
+    return json_dumps_bytes(response)
 
 
 @app.route('/connect-peer', methods=['OPTIONS'])
 def connect_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 
 @app.route('/connect-peer', methods=['POST'])
@@ -724,42 +867,58 @@ def connect_peer(headers="guest", body="anonymous"):
     :param body (str): JSON request body
     :return: JSON response with peer connection info
     """
-    print("[ChatApp] Connect-peer request received")
+    log.debug("[ChatApp] Connect-peer request received")
     
     try:
         if not body or body == "anonymous":
-            return json.dumps({"status": "error", "message": "Missing request body"})
+            return _ERR_MISSING_BODY
         
-        data = json.loads(body)
+        if body and len(body) > MAX_FORM_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body)
+        if data is None:
+            return _ERR_INVALID_JSON
         username = data.get("username", "")
         target_username = data.get("target_username", None)
         channel = data.get("channel", None)
         
         if not username:
-            return json.dumps({"status": "error", "message": "Username required"})
+            return _ERR_USERNAME_REQUIRED
         
         # Find peers to connect to
         peers_to_connect = []
+        snapshot = _current_peers()
         
-        with peers_lock:
-            for peer in peers_list:
-                if peer["username"] == username:
-                    continue  # Skip self
-                
-                # Filter by target username if specified
-                if target_username and peer["username"] != target_username:
+        # Narrow the candidates through the indexes; the filters below
+        # still apply
+        if target_username and isinstance(target_username, str):
+            peer = snapshot.by_username.get(target_username)
+            candidates = () if peer is None else (peer,)
+        elif channel and isinstance(channel, str):
+            by_username = snapshot.by_username
+            candidates = [by_username[member] for member in channels_list.get(channel, ())
+                          if member in by_username]
+        else:
+            candidates = snapshot.peers
+        
+        for peer in candidates:
+            if peer["username"] == username:
+                continue  # Skip self
+            
+            # Filter by target username if specified
+            if target_username and peer["username"] != target_username:
+                continue
+            
+            # Filter by channel if specified
+            if channel:
+                if channel not in peer.get("channels", ()):
                     continue
-                
-                # Filter by channel if specified
-                if channel:
-                    if channel not in peer.get("channels", []):
-                        continue
-                
-                peers_to_connect.append({
-                    "username": peer["username"],
-                    "ip": peer["ip"],
-                    "port": peer["port"]
-                })
+            
+            peers_to_connect.append({
+                "username": peer["username"],
+                "ip": peer["ip"],
+                "port": peer["port"]
+            })
         
         response = {
             "status": "success",
@@ -767,27 +926,19 @@ def connect_peer(headers="guest", body="anonymous"):
             "peers": peers_to_connect
         }
         
-        print("[ChatApp] Connect-peer: {} peers found for {}".format(
-            len(peers_to_connect), username))
+        log.debug("[ChatApp] Connect-peer: %s peers found for %s", len(peers_to_connect), username)
         
-        return json.dumps(response)
+        return json_dumps_bytes(response)
     
-    except json.JSONDecodeError:
-        return json.dumps({"status": "error", "message": "Invalid JSON"})
     except Exception as e:
-        print("[ChatApp] Error in connect-peer: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in connect-peer: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/broadcast-peer', methods=['OPTIONS'])
 def broadcast_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_POST_OK
 
 
 @app.route('/broadcast-peer', methods=['POST'])
@@ -818,30 +969,31 @@ def broadcast_peer(headers="guest", body="anonymous"):
     :param body (str): JSON request body
     :return: JSON response
     """
-    print("[ChatApp] Broadcast-peer request received")
+    log.debug("[ChatApp] Broadcast-peer request received")
     
     try:
         if not body or body == "anonymous":
-            return json.dumps({"status": "error", "message": "Missing request body"})
+            return _ERR_MISSING_BODY
         
-        data = json.loads(body)
+        if body and len(body) > MAX_FORM_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body)
+        if data is None:
+            return _ERR_INVALID_JSON
         username = data.get("username", "")
         channel = data.get("channel", "")
         message = data.get("message", "")
         
         if not username or not channel:
-            return json.dumps({"status": "error", "message": "Username and channel required"})
-        
-        # Count recipients in channel
-        recipient_count = 0
+            return _ERR_USERNAME_CHANNEL_REQUIRED
         
-        with peers_lock:
-            for peer in peers_list:
-                if peer["username"] == username:
-                    continue  # Skip sender
-                
-                if channel in peer.get("channels", []):
-                    recipient_count += 1
+        # Count recipients in channel: registered members other than the sender
+        members = channels_list.get(channel, ()) if isinstance(channel, str) else ()
+        by_username = _current_peers().by_username
+        recipient_count = sum(
+            1 for member in members
+            if member != username
+            and channel in by_username.get(member, _NO_PEER).get("channels", ()))
         
         # In true P2P, actual broadcasting happens directly between peers
         # This API just acknowledges the broadcast request
@@ -852,27 +1004,19 @@ def broadcast_peer(headers="guest", body="anonymous"):
             "note": "Actual P2P broadcast should be done directly between peers"
         }
         
-        print("[ChatApp] Broadcast-peer: {} recipients in channel '{}'".format(
-            recipient_count, channel))
+        log.debug("[ChatApp] Broadcast-peer: %s recipients in channel '%s'", recipient_count, channel)
         
-        return json.dumps(response)
+        return json_dumps_bytes(response)
     
-    except json.JSONDecodeError:
-        return json.dumps({"status": "error", "message": "Invalid JSON"})
     except Exception as e:
-        print("[ChatApp] Error in broadcast-peer: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in broadcast-peer: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 @app.route('/send-peer', methods=['OPTIONS'])
 def send_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_POST_OK
 
 
 @app.route('/send-peer', methods=['POST'])
@@ -903,35 +1047,29 @@ def send_peer(headers="guest", body="anonymous"):
     :param body (str): JSON request body
     :return: JSON response with target peer info
     """
-    print("[ChatApp] Send-peer request received")
+    log.debug("[ChatApp] Send-peer request received")
     
     try:
         if not body or body == "anonymous":
-            return json.dumps({"status": "error", "message": "Missing request body"})
+            return _ERR_MISSING_BODY
         
-        data = json.loads(body)
+        if body and len(body) > MAX_FORM_BODY:
+            return _ERR_BODY_TOO_LARGE
+        data = _json_object(body)
+        if data is None:
+            return _ERR_INVALID_JSON
         from_username = data.get("from_username", "")
         to_username = data.get("to_username", "")
         message = data.get("message", "")
         
         if not from_username or not to_username:
-            return json.dumps({"status": "error", "message": "From and to usernames required"})
+            return _ERR_FROM_TO_REQUIRED
         
         # Find target peer
-        target_peer = None
+        peer = _current_peers().by_username.get(to_username) if isinstance(to_username, str) else None
         
-        with peers_lock:
-            for peer in peers_list:
-                if peer["username"] == to_username:
-                    target_peer = {
-                        "username": peer["username"],
-                        "ip": peer["ip"],
-                        "port": peer["port"]
-                    }
-                    break
-        
-        if not target_peer:
-            return json.dumps({
+        if peer is None:
+            return json_dumps_bytes({
                 "status": "error",
                 "message": "Target peer '{}' not found".format(to_username)
             })
@@ -941,23 +1079,24 @@ def send_peer(headers="guest", body="anonymous"):
         response = {
             "status": "success",
             "message": "Peer info retrieved for direct messaging",
-            "target_peer": target_peer,
+            "target_peer": {k: peer[k] for k in _TARGET_PEER_FIELDS},
             "note": "Actual P2P messaging should be done via direct TCP socket connection"
         }
         
-        print("[ChatApp] Send-peer: {} -> {} ({}:{})".format(
-            from_username, to_username, target_peer["ip"], target_peer["port"]))
+        log.debug("[ChatApp] Send-peer: %s -> %s (%s:%s)",
+                  from_username, to_username, peer["ip"], peer["port"])
         
-        return json.dumps(response)
+        return json_dumps_bytes(response)
     
-    except json.JSONDecodeError:
-        return json.dumps({"status": "error", "message": "Invalid JSON"})
     except Exception as e:
-        print("[ChatApp] Error in send-peer: {}".format(e))
-        return json.dumps({"status": "error", "message": str(e)})
+        log.warning("[ChatApp] Error in send-peer: %s", e)
+        return json_dumps_bytes({"status": "error", "message": str(e)})
 
 
 if __name__ == "__main__":
+    # Only needed at startup; importing this module for its app skips it
+    import argparse
+
     # Parse command-line arguments to configure server IP and port
     parser = argparse.ArgumentParser(
         prog='ChatApp Tracker Server',
@@ -966,18 +1105,24 @@ if __name__ == "__main__":
     )
     parser.add_argument('--server-ip', default='0.0.0.0', help='IP address to bind')
     parser.add_argument('--server-port', type=int, default=PORT, help='Port number')
+    parser.add_argument('--log-level', default='WARNING',
+                        help='Handler log level (DEBUG shows per-request traces)')
  
     args = parser.parse_args()
     ip = args.server_ip
     port = args.server_port
 
+    logging.basicConfig(level=args.log_level.upper(), format='%(message)s')
+
     print("="*60)
     print("Starting Chat Tracker Server")
     print("IP: {}".format(ip))
     print("Port: {}".format(port))
     print("="*60)
 
-    # Prepare and launch the chat tracker server
+    # Prepare and launch the chat tracker server. Requests are read on one
+    # event loop and answered from a small thread pool, not a thread per
+    # connection.
     app.prepare_address(ip, port)
-    app.run()
+    app.run(use_asyncio=True)
 
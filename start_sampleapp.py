@@ -26,7 +26,7 @@ and can be configured via command-line arguments.
 
 import json
 import socket
-import argparse
+import logging
 
 from apps.sampleApp import app
 
@@ -34,6 +34,8 @@ from apps.sampleApp import app
 PORT = 8000  # Default port
 
 if __name__ == "__main__":
+    import argparse
+
     # Parse command-line arguments to configure server IP and port
     parser = argparse.ArgumentParser(
         prog='Backend', 
@@ -42,11 +44,15 @@ if __name__ == "__main__":
     )
     parser.add_argument('--server-ip', default='0.0.0.0')
     parser.add_argument('--server-port', type=int, default=PORT)
+    parser.add_argument('--log-level', default='WARNING',
+                        help='Handler log level (DEBUG shows per-request traces)')
  
     args = parser.parse_args()
     ip = args.server_ip
     port = args.server_port
 
+    logging.basicConfig(level=args.log_level.upper(), format='%(message)s')
+
     # Logs
     print("*" * 60)
     print("Starting Chat Tracker Server")
@@ -57,4 +63,6 @@ if __name__ == "__main__":
 
     # Prepare and launch the RESTful application
     app.prepare_address(ip, port)
-    app.run()
\ No newline at end of file
+    # Requests are read on one event loop and answered from a small thread
+    # pool, without paying for a thread per connection.
+    app.run(use_asyncio=True)
\ No newline at end of file
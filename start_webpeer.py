@@ -29,31 +29,98 @@ This enables web interfaces to use P2P paradigm while maintaining
 the client-server paradigm for API communication.
 """
 
-import json
+import logging
 import socket
-import argparse
 import threading
+from types import MappingProxyType
 from daemon.weaprous import WeApRous
-from peer_client import PeerClient
+from daemon.utils import json_dumps_bytes, json_loads
+from peer_client import PeerClient, configure_logging
 
 PORT = 8002  # Default port for web peer service
 
-# Global peer instances: {username: PeerClient}
+log = logging.getLogger("webpeer")
+
+# Global peer instances: {username: PeerClient}. Copy-on-write: init_peer
+# publishes a new dict under peer_instances_lock, the other handlers read
+# the current one without locking.
 peer_instances = {}
 peer_instances_lock = threading.Lock()
 
+# Every OPTIONS response is the same; complete headers and a bytes body
+# let the adapter send it as-is
+_PREFLIGHT_OK = ("200 OK", MappingProxyType({
+    "Content-Type": "text/plain; charset=utf-8",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Max-Age": "86400"
+}), b"")
+
+# Headers for JSON success tuples, shared read-only: the adapter copies
+# them when it has to add anything
+_JSON_CORS_HEADERS = MappingProxyType({
+    "Content-Type": "application/json; charset=utf-8",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type"
+})
+
+# Constant responses, serialized once
+_ERR_MISSING_USERNAME_OR_PORT = json_dumps_bytes({"status": "failed", "message": "Missing username or peer_port"})
+_ERR_CALL_INIT_PEER = json_dumps_bytes({"status": "failed", "message": "Peer not initialized. Call /init-peer first"})
+_ERR_PEER_NOT_INIT = json_dumps_bytes({"status": "failed", "message": "Peer not initialized"})
+_MESSAGE_SENT = json_dumps_bytes({"status": "success", "message": "Message sent"})
+_ERR_SEND_FAILED = json_dumps_bytes({"status": "failed", "message": "Failed to send message"})
+_ERR_MISSING_USERNAME = json_dumps_bytes({"status": "failed", "message": "Missing username"})
+_ERR_MISSING_BODY = json_dumps_bytes({"status": "failed", "message": "Missing request body"})
+_ERR_MISSING_USER_CHANNEL = json_dumps_bytes({"status": "failed", "message": "Missing username or channel"})
+_ERR_JOIN_FAILED = json_dumps_bytes({"status": "failed", "message": "Failed to join channel. Check tracker connection and peer status."})
+_NO_MESSAGES = json_dumps_bytes({"status": "success", "messages": []})
+_INIT_OK = ("200 OK", _JSON_CORS_HEADERS,
+            json_dumps_bytes({"status": "success", "message": "Peer initialized successfully"}))
+# Only an int varies here, so formatting cannot produce invalid JSON
+_BROADCAST_OK = '{{"status":"success","sent_count":{0},"message":"Broadcasted to {0} peers"}}'
+
+# Fields each handler needs with a non-empty value
+_INIT_REQUIRED = frozenset(("username", "peer_port"))
+_CONNECT_REQUIRED = frozenset(("username", "peer_username", "peer_ip", "peer_port"))
+_SEND_REQUIRED = frozenset(("username", "peer_username", "message"))
+_BROADCAST_REQUIRED = frozenset(("username", "message"))
+
 app = WeApRous()
 
+def _parse_body(body):
+    """
+    Parse a JSON request body (str or bytes) into a dict; {} when there is
+    none. Raises ValueError for invalid JSON or a non-object document.
+    """
+    if not body or body == "anonymous":
+        return {}
+    data = json_loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    return data
+
+
+def _missing(data, required):
+    """Return the required fields that are absent or empty in data."""
+    return required - {k for k, v in data.items() if v}
+
+
+def _err_missing(missing):
+    """Build a failed response naming the missing fields."""
+    return json_dumps_bytes({
+        "status": "failed",
+        "message": "Missing required fields: {}".format(", ".join(sorted(missing)))
+    })
+
+
 # CORS OPTIONS handlers
 @app.route('/init-peer', methods=['OPTIONS'])
 def init_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/init-peer', methods=['POST'])
 def init_peer(headers="guest", body="anonymous"):
@@ -70,64 +137,67 @@ def init_peer(headers="guest", body="anonymous"):
     
     Response: {"status": "success"/"failed", "message": str}
     """
-    print("[WebPeer] Init peer request received")
+    global peer_instances
+    log.debug("[WebPeer] Init peer request received")
     
     try:
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
+        data = _parse_body(body)
+        if _missing(data, _INIT_REQUIRED):
+            return _ERR_MISSING_USERNAME_OR_PORT
+        
+        username = data["username"]
         peer_ip = data.get("peer_ip", "0.0.0.0")
-        peer_port = data.get("peer_port", 0)
+        peer_port = data["peer_port"]
         tracker_ip = data.get("tracker_ip", "127.0.0.1")
         tracker_port = data.get("tracker_port", 8001)
         
-        if not username or not peer_port:
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing username or peer_port"
-            })
+        # Only the dict swaps happen under the lock; stopping, binding and
+        # registering with the tracker are network I/O and run outside it.
+        with peer_instances_lock:
+            old = peer_instances.get(username)
+            if old is not None:
+                peer_instances = {k: v for k, v in peer_instances.items()
+                                  if k != username}
+        if old is not None:
+            try:
+                old.stop()
+            except Exception:
+                pass
+        
+        # Create new PeerClient instance
+        peer = PeerClient(
+            username=username,
+            peer_ip=peer_ip,
+            peer_port=peer_port,
+            tracker_ip=tracker_ip,
+            tracker_port=tracker_port
+        )
+        
+        # Start peer
+        peer.start()
         
+        # Register with tracker
+        peer.register_with_tracker()
+        
+        # Store instance: publish a new dict so readers never lock. A
+        # concurrent init for the same user may have landed meanwhile;
+        # the later one wins and the displaced peer is stopped.
         with peer_instances_lock:
-            # Close existing instance if any
-            if username in peer_instances:
-                try:
-                    peer_instances[username].stop()
-                except:
-                    pass
-            
-            # Create new PeerClient instance
-            peer = PeerClient(
-                username=username,
-                peer_ip=peer_ip,
-                peer_port=peer_port,
-                tracker_ip=tracker_ip,
-                tracker_port=tracker_port
-            )
-            
-            # Start peer
-            peer.start()
-            
-            # Register with tracker
-            peer.register_with_tracker()
-            
-            # Store instance
-            peer_instances[username] = peer
-            
-            print("[WebPeer] Initialized peer for user: {}".format(username))
+            displaced = peer_instances.get(username)
+            peer_instances = {**peer_instances, username: peer}
+        if displaced is not None:
+            try:
+                displaced.stop()
+            except Exception:
+                pass
         
-        response = {
-            "status": "success",
-            "message": "Peer initialized successfully"
-        }
-        return ("200 OK", {
-            "Content-Type": "application/json; charset=utf-8",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type"
-        }, json.dumps(response))
+        log.debug("[WebPeer] Initialized peer for user: %s", username)
+        
+        return _INIT_OK
     
     except Exception as e:
-        print("[WebPeer] Error initializing peer: {}".format(e))
-        return json.dumps({
+        log.warning("[WebPeer] Error initializing peer: %s", e)
+        return json_dumps_bytes({
             "status": "error",
             "message": str(e)
         })
@@ -136,12 +206,7 @@ def init_peer(headers="guest", body="anonymous"):
 @app.route('/connect-peer', methods=['OPTIONS'])
 def connect_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/connect-peer', methods=['POST'])
 def connect_peer(headers="guest", body="anonymous"):
@@ -157,46 +222,39 @@ def connect_peer(headers="guest", body="anonymous"):
     
     Response: {"status": "success"/"failed", "message": str}
     """
-    print("[WebPeer] Connect peer request received")
+    log.debug("[WebPeer] Connect peer request received")
     
     try:
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
-        peer_username = data.get("peer_username", "")
-        peer_ip = data.get("peer_ip", "")
-        peer_port = data.get("peer_port", 0)
+        data = _parse_body(body)
+        missing = _missing(data, _CONNECT_REQUIRED)
+        if missing:
+            return _err_missing(missing)
         
-        if not username or not peer_username or not peer_ip or not peer_port:
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing required fields"
-            })
+        username = data["username"]
+        peer_username = data["peer_username"]
+        peer_ip = data["peer_ip"]
+        peer_port = data["peer_port"]
         
-        with peer_instances_lock:
-            if username not in peer_instances:
-                return json.dumps({
-                    "status": "failed",
-                    "message": "Peer not initialized. Call /init-peer first"
-                })
-            
-            peer = peer_instances[username]
+        peer = peer_instances.get(username)
+        if peer is None:
+            return _ERR_CALL_INIT_PEER
         
         success = peer.connect_peer(peer_username, peer_ip, peer_port)
         
         if success:
-            return json.dumps({
+            return json_dumps_bytes({
                 "status": "success",
                 "message": "Connected to peer: {}".format(peer_username)
             })
         else:
-            return json.dumps({
+            return json_dumps_bytes({
                 "status": "failed",
                 "message": "Failed to connect to peer: {}".format(peer_username)
             })
     
     except Exception as e:
-        print("[WebPeer] Error connecting peer: {}".format(e))
-        return json.dumps({
+        log.warning("[WebPeer] Error connecting peer: %s", e)
+        return json_dumps_bytes({
             "status": "error",
             "message": str(e)
         })
@@ -205,12 +263,7 @@ def connect_peer(headers="guest", body="anonymous"):
 @app.route('/send-peer', methods=['OPTIONS'])
 def send_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/send-peer', methods=['POST'])
 def send_peer(headers="guest", body="anonymous"):
@@ -226,46 +279,33 @@ def send_peer(headers="guest", body="anonymous"):
     
     Response: {"status": "success"/"failed", "message": str}
     """
-    print("[WebPeer] Send peer message request received")
+    log.debug("[WebPeer] Send peer message request received")
     
     try:
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
-        peer_username = data.get("peer_username", "")
-        message = data.get("message", "")
-        channel = data.get("channel", "direct")
+        data = _parse_body(body)
+        missing = _missing(data, _SEND_REQUIRED)
+        if missing:
+            return _err_missing(missing)
         
-        if not username or not peer_username or not message:
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing required fields"
-            })
+        username = data["username"]
+        peer_username = data["peer_username"]
+        message = data["message"]
+        channel = data.get("channel", "direct")
         
-        with peer_instances_lock:
-            if username not in peer_instances:
-                return json.dumps({
-                    "status": "failed",
-                    "message": "Peer not initialized"
-                })
-            
-            peer = peer_instances[username]
+        peer = peer_instances.get(username)
+        if peer is None:
+            return _ERR_PEER_NOT_INIT
         
         success = peer.send_peer(peer_username, message, channel)
         
         if success:
-            return json.dumps({
-                "status": "success",
-                "message": "Message sent"
-            })
+            return _MESSAGE_SENT
         else:
-            return json.dumps({
-                "status": "failed",
-                "message": "Failed to send message"
-            })
+            return _ERR_SEND_FAILED
     
     except Exception as e:
-        print("[WebPeer] Error sending message: {}".format(e))
-        return json.dumps({
+        log.warning("[WebPeer] Error sending message: %s", e)
+        return json_dumps_bytes({
             "status": "error",
             "message": str(e)
         })
@@ -274,12 +314,7 @@ def send_peer(headers="guest", body="anonymous"):
 @app.route('/broadcast-peer', methods=['OPTIONS'])
 def broadcast_peer_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/broadcast-peer', methods=['POST'])
 def broadcast_peer(headers="guest", body="anonymous"):
@@ -294,40 +329,29 @@ def broadcast_peer(headers="guest", body="anonymous"):
     
     Response: {"status": "success", "sent_count": int}
     """
-    print("[WebPeer] Broadcast peer message request received")
+    log.debug("[WebPeer] Broadcast peer message request received")
     
     try:
-        data = json.loads(body) if body and body != "anonymous" else {}
-        username = data.get("username", "")
-        message = data.get("message", "")
-        channel = data.get("channel", "broadcast")
+        data = _parse_body(body)
+        missing = _missing(data, _BROADCAST_REQUIRED)
+        if missing:
+            return _err_missing(missing)
         
-        if not username or not message:
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing required fields"
-            })
+        username = data["username"]
+        message = data["message"]
+        channel = data.get("channel", "broadcast")
         
-        with peer_instances_lock:
-            if username not in peer_instances:
-                return json.dumps({
-                    "status": "failed",
-                    "message": "Peer not initialized"
-                })
-            
-            peer = peer_instances[username]
+        peer = peer_instances.get(username)
+        if peer is None:
+            return _ERR_PEER_NOT_INIT
         
         sent_count = peer.broadcast_peer(message, channel)
         
-        return json.dumps({
-            "status": "success",
-            "sent_count": sent_count,
-            "message": "Broadcasted to {} peers".format(sent_count)
-        })
+        return _BROADCAST_OK.format(int(sent_count)).encode()
     
     except Exception as e:
-        print("[WebPeer] Error broadcasting: {}".format(e))
-        return json.dumps({
+        log.warning("[WebPeer] Error broadcasting: %s", e)
+        return json_dumps_bytes({
             "status": "error",
             "message": str(e)
         })
@@ -336,12 +360,7 @@ def broadcast_peer(headers="guest", body="anonymous"):
 @app.route('/get-messages', methods=['OPTIONS'])
 def get_messages_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/get-messages', methods=['POST'])
 def get_messages(headers="guest", body="anonymous"):
@@ -355,38 +374,30 @@ def get_messages(headers="guest", body="anonymous"):
     
     Response: {"status": "success", "messages": [...]}
     """
-    print("[WebPeer] Get messages request received")
+    log.debug("[WebPeer] Get messages request received")
     
     try:
-        data = json.loads(body) if body and body != "anonymous" else {}
+        data = _parse_body(body)
         username = data.get("username", "")
         channel = data.get("channel", None)
         
         if not username:
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing username"
-            })
+            return _ERR_MISSING_USERNAME
         
-        with peer_instances_lock:
-            if username not in peer_instances:
-                return json.dumps({
-                    "status": "success",
-                    "messages": []
-                })
-            
-            peer = peer_instances[username]
+        peer = peer_instances.get(username)
+        if peer is None:
+            return _NO_MESSAGES
         
         messages = peer.get_messages(channel)
         
-        return json.dumps({
+        return json_dumps_bytes({
             "status": "success",
             "messages": messages
         })
     
     except Exception as e:
-        print("[WebPeer] Error getting messages: {}".format(e))
-        return json.dumps({
+        log.warning("[WebPeer] Error getting messages: %s", e)
+        return json_dumps_bytes({
             "status": "error",
             "message": str(e),
             "messages": []
@@ -396,12 +407,7 @@ def get_messages(headers="guest", body="anonymous"):
 @app.route('/join-channel', methods=['OPTIONS'])
 def join_channel_options(headers="guest", body="anonymous"):
     """Handle OPTIONS preflight request for CORS."""
-    return ("200 OK", {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Methods": "POST, OPTIONS",
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Max-Age": "86400"
-    }, "")
+    return _PREFLIGHT_OK
 
 @app.route('/join-channel', methods=['POST'])
 def join_channel(headers="guest", body="anonymous"):
@@ -415,78 +421,62 @@ def join_channel(headers="guest", body="anonymous"):
     
     Response: {"status": "success"/"failed", "message": str}
     """
-    print("[WebPeer] Join channel request received")
-    print("[WebPeer] Request body: {}".format(body))
+    log.debug("[WebPeer] Join channel request received")
+    log.debug("[WebPeer] Request body: %s", body)
     
     try:
         if not body or body == "anonymous":
-            print("[WebPeer] Error: Empty body")
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing request body"
-            })
+            log.debug("[WebPeer] Error: Empty body")
+            return _ERR_MISSING_BODY
         
-        data = json.loads(body)
+        data = _parse_body(body)
         username = data.get("username", "")
         channel = data.get("channel", "")
         
-        print("[WebPeer] Parsed data - username: {}, channel: {}".format(username, channel))
+        log.debug("[WebPeer] Parsed data - username: %s, channel: %s", username, channel)
         
         if not username or not channel:
-            print("[WebPeer] Error: Missing username or channel")
-            return json.dumps({
-                "status": "failed",
-                "message": "Missing username or channel"
-            })
+            log.debug("[WebPeer] Error: Missing username or channel")
+            return _ERR_MISSING_USER_CHANNEL
         
-        with peer_instances_lock:
-            if username not in peer_instances:
-                print("[WebPeer] Error: Peer '{}' not initialized".format(username))
-                return json.dumps({
-                    "status": "failed",
-                    "message": "Peer not initialized. Call /init-peer first"
-                })
-            
-            peer = peer_instances[username]
+        peer = peer_instances.get(username)
+        if peer is None:
+            log.debug("[WebPeer] Error: Peer '%s' not initialized", username)
+            return _ERR_CALL_INIT_PEER
         
-        print("[WebPeer] Calling peer.join_channel('{}') for user '{}'...".format(channel, username))
+        log.debug("[WebPeer] Calling peer.join_channel('%s') for user '%s'...", channel, username)
         
         try:
             success = peer.join_channel(channel)
-            print("[WebPeer] peer.join_channel returned: {}".format(success))
+            log.debug("[WebPeer] peer.join_channel returned: %s", success)
         except Exception as peer_error:
-            print("[WebPeer] Exception in peer.join_channel: {}".format(peer_error))
-            import traceback
-            traceback.print_exc()
-            return json.dumps({
+            log.warning("[WebPeer] Exception in peer.join_channel: %s", peer_error)
+            log.debug("[WebPeer] join_channel traceback", exc_info=True)
+            return json_dumps_bytes({
                 "status": "error",
                 "message": "Error in peer.join_channel: {}".format(str(peer_error))
             })
         
         if success:
-            print("[WebPeer] Successfully joined channel '{}' for user '{}'".format(channel, username))
-            return json.dumps({
+            log.debug("[WebPeer] Successfully joined channel '%s' for user '%s'", channel, username)
+            return json_dumps_bytes({
                 "status": "success",
                 "message": "Joined channel: {}".format(channel)
             })
         else:
-            print("[WebPeer] Failed to join channel '{}' for user '{}'".format(channel, username))
-            return json.dumps({
-                "status": "failed",
-                "message": "Failed to join channel. Check tracker connection and peer status."
-            })
+            log.warning("[WebPeer] Failed to join channel '%s' for user '%s'", channel, username)
+            return _ERR_JOIN_FAILED
     
-    except json.JSONDecodeError as e:
-        print("[WebPeer] JSON decode error: {}".format(e))
-        return json.dumps({
+    except ValueError as e:
+        log.warning("[WebPeer] JSON decode error: %s", e)
+        return json_dumps_bytes({
             "status": "error",
             "message": "Invalid JSON: {}".format(str(e))
         })
     except Exception as e:
-        print("[WebPeer] Unexpected error joining channel: {}".format(e))
-        import traceback
-        traceback.print_exc()
-        return json.dumps({
+        log.warning("[WebPeer] Unexpected error joining channel: %s", e)
+        log.debug("[WebPeer] join_channel traceback", exc_info=True)
+        return json_dumps_bytes({
             "status": "error",
             "message": str(e)
         })
@@ -495,10 +485,9 @@ def join_channel(headers="guest", body="anonymous"):
 @app.route('/status', methods=['GET'])
 def status(headers="guest", body="anonymous"):
     """Get service status."""
-    with peer_instances_lock:
-        active_peers = len(peer_instances)
+    active_peers = len(peer_instances)
     
-    return json.dumps({
+    return json_dumps_bytes({
         "status": "online",
         "active_peer_instances": active_peers,
         "service": "WebPeer Bridge"
@@ -506,6 +495,8 @@ def status(headers="guest", body="anonymous"):
 
 
 if __name__ == "__main__":
+    import argparse  # Only when run as a script
+
     parser = argparse.ArgumentParser(
         prog='WebPeer Bridge Service',
         description='Bridges web interface to P2P communication',
@@ -513,11 +504,15 @@ if __name__ == "__main__":
     )
     parser.add_argument('--server-ip', default='0.0.0.0', help='IP address to bind')
     parser.add_argument('--server-port', type=int, default=PORT, help='Port number')
+    parser.add_argument('--log-level', default='WARNING',
+                        help='Log level (DEBUG shows per-request traces and every P2P message)')
  
     args = parser.parse_args()
     ip = args.server_ip
     port = args.server_port
 
+    configure_logging(args.log_level)
+
     print("="*60)
     print("Starting WebPeer Bridge Service")
     print("IP: {}".format(ip))
@@ -527,5 +522,7 @@ if __name__ == "__main__":
     print("Web interface can now use P2P messaging through HTTP API.\n")
 
     app.prepare_address(ip, port)
+    # Stays on a thread per connection: handlers block on tracker requests
+    # and peer connects, which would stall a single event loop.
     app.run()
 